@@ -1,5 +1,6 @@
 """Step 1: Check for new PDFs by comparing CSV and cloud storage."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 import pandas as pd
@@ -20,14 +21,18 @@ def check_for_new_pdfs() -> tuple[datetime, set[str]]:
     print("-" * 80)
     print(" 🔍 Step 1: Checking for new PDFs...")
     
+    # Fetch public CSV and cloud PDF listing concurrently (independent network calls)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        csv_future = executor.submit(read_csv_from_cloud, "extracted_estimates.csv", usecols=['Report_Date'])
+        cloud_pdfs_future = executor.submit(list_cloud_files, 'reports/')
+    
     # Get last date from public URL CSV
     last_date = None
     try:
-        df = read_csv_from_cloud("extracted_estimates.csv")
+        df = csv_future.result()
         
-        if df is not None and not df.empty and 'Report_Date' in df.columns:
-            df['Report_Date'] = pd.to_datetime(df['Report_Date'])
-            last_date = df['Report_Date'].max().to_pydatetime()
+        if df is not None and not df.empty:
+            last_date = pd.to_datetime(df['Report_Date']).max().to_pydatetime()
             print(f"📅 Last report date in public CSV: {last_date.strftime('%Y-%m-%d')}")
         else:
             print("ℹ️  No existing CSV data (first run)")
@@ -35,7 +40,7 @@ def check_for_new_pdfs() -> tuple[datetime, set[str]]:
         print(f"⚠️  Could not read CSV from public URL: {e}")
     
     # Get cloud PDF list
-    cloud_pdfs = list_cloud_files('reports/')
+    cloud_pdfs = cloud_pdfs_future.result()
     cloud_pdf_names = {Path(p).name for p in cloud_pdfs}
     print(f"📦 Found {len(cloud_pdf_names)} PDFs in cloud")
     
@@ -5,12 +5,13 @@ from pathlib import Path
 from src.factset_report_analyzer import extract_charts
 
 
-def extract_chart_pages(pdf_files: list[Path]) -> list[tuple[str, bytes]]:
+def extract_chart_pages(pdf_files: list[Path], workers: int = 1) -> list[tuple[str, bytes]]:
     """
     Extract EPS chart pages as PNGs from PDFs.
     
     Args:
         pdf_files: List of PDF file paths
+        workers: Number of worker processes for PDF parsing (1 to process serially)
         
     Returns:
         List of tuples (filename, image_bytes)
@@ -18,7 +19,7 @@ def extract_chart_pages(pdf_files: list[Path]) -> list[tuple[str, bytes]]:
     print("-" * 80)
     print(" 🖼️  Step 3: Extracting EPS chart pages...")
     
-    chart_data = extract_charts(pdf_files)
+    chart_data = extract_charts(pdf_files, workers=workers)
     print(f"✅ PNG extraction complete: {len(chart_data)} charts\n")
     
     return chart_data
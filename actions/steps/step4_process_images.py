@@ -6,12 +6,13 @@ import pandas as pd
 from src.factset_report_analyzer import process_images
 
 
-def process_chart_images(directory: Path) -> tuple[pd.DataFrame, pd.DataFrame]:
+def process_chart_images(directory: Path, workers: int = 1) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Process chart images and extract EPS data.
     
     Args:
         directory: Directory containing chart images
+        workers: Number of worker processes for OCR (1 to process serially)
         
     Returns:
         Tuple of (main_df, confidence_df)
@@ -19,7 +20,7 @@ def process_chart_images(directory: Path) -> tuple[pd.DataFrame, pd.DataFrame]:
     print("-" * 80)
     print(" 🔍 Step 4: Processing images and extracting data...")
     
-    df_main, df_confidence = process_images(directory=directory)
+    df_main, df_confidence = process_images(directory=directory, workers=workers)
     print(f"✅ Image processing complete: {len(df_main)} records\n")
     
     return df_main, df_confidence
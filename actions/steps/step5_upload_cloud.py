@@ -2,10 +2,13 @@
 
 from pathlib import Path
 
-from src.factset_report_analyzer.utils import upload_to_cloud
+from src.factset_report_analyzer.utils import upload_many_to_cloud
 from src.factset_report_analyzer.utils.cloudflare import write_csv_to_cloud
 import pandas as pd
 
+# Uploads are latency-bound; keep concurrency modest to stay within R2 limits
+UPLOAD_WORKERS = 8
+
 
 def upload_results_to_cloud(
     pdf_files: list[Path],
@@ -28,8 +31,8 @@ def upload_results_to_cloud(
     print("-" * 80)
     print(" ☁️  Step 5: Uploading results to cloud...")
     
-    failed_pdfs = [p.name for p in pdf_files if not upload_to_cloud(p, f"reports/{p.name}")]
-    failed_pngs = [p.name for p in chart_files if not upload_to_cloud(p, f"estimates/{p.name}")]
+    failed_pdfs = _upload_files(pdf_files, "reports/")
+    failed_pngs = _upload_files(chart_files, "estimates/")
     
     if failed_pdfs:
         raise Exception(f"Failed to upload PDFs: {', '.join(failed_pdfs)}")
@@ -45,3 +48,8 @@ def upload_results_to_cloud(
     
     print(f"✅ Uploaded extracted_estimates.csv and extracted_estimates_confidence.csv")
 
+
+def _upload_files(files: list[Path], prefix: str) -> list[str]:
+    """Upload files concurrently under prefix and return names of failed uploads."""
+    results = upload_many_to_cloud([(p, f"{prefix}{p.name}") for p in files], max_workers=UPLOAD_WORKERS)
+    return [p.name for p, ok in zip(files, results) if not ok]
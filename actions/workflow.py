@@ -9,6 +9,7 @@ This script runs the full workflow:
 6. Generate and upload P/E ratio plot
 """
 
+import argparse
 import sys
 import tempfile
 from datetime import datetime
@@ -31,6 +32,11 @@ from actions.steps import (
 
 def main():
     """Run complete data collection workflow."""
+    parser = argparse.ArgumentParser(description="EPS estimates collection workflow")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Number of worker processes for chart extraction and image OCR (default: 1)")
+    args = parser.parse_args()
+    
     print("=" * 80)
     print("🚀 EPS Estimates Collection Workflow")
     print("=" * 80)
@@ -55,7 +61,7 @@ def main():
         
         # Steps 3-5: Process PDFs if new ones were downloaded
         if pdfs:
-            _process_new_pdfs(pdfs)
+            _process_new_pdfs(pdfs, workers=args.workers)
         
         # Step 6: Generate and upload P/E ratio plot (always runs)
         generate_pe_ratio_plot()
@@ -72,7 +78,7 @@ def main():
     print("=" * 80)
 
 
-def _process_new_pdfs(pdfs: list[dict]) -> None:
+def _process_new_pdfs(pdfs: list[dict], workers: int = 1) -> None:
     """Process newly downloaded PDFs through steps 3-5."""
     with tempfile.TemporaryDirectory() as tmp_dir:
         tmp_path = Path(tmp_dir)
@@ -85,7 +91,7 @@ def _process_new_pdfs(pdfs: list[dict]) -> None:
             pdf_files.append(pdf_path)
         
         # Step 3: Extract chart pages
-        chart_data = extract_chart_pages(pdf_files)
+        chart_data = extract_chart_pages(pdf_files, workers=workers)
         
         # Save PNGs to temp files
         chart_files = []
@@ -95,7 +101,7 @@ def _process_new_pdfs(pdfs: list[dict]) -> None:
             chart_files.append(chart_path)
         
         # Step 4: Process images
-        df_main, df_confidence = process_chart_images(tmp_path)
+        df_main, df_confidence = process_chart_images(tmp_path, workers=workers)
         
         # Step 5: Upload to cloud
         upload_results_to_cloud(pdf_files, chart_files, df_main, df_confidence)
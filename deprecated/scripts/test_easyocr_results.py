@@ -5,7 +5,46 @@ import cv2
 import numpy as np
 import pandas as pd
 import easyocr
-from src.chart_ocr_processor.craft_detector import CRAFTDetector
+from src.chart_ocr_processor.craft_detector import get_default_device, get_detector
+
+# EasyOCR Reader는 생성 비용이 커서 모듈 단위로 한 번만 생성
+_reader = None
+
+
+def _get_reader() -> easyocr.Reader:
+    """모듈 단위로 캐시된 EasyOCR Reader를 반환합니다."""
+    global _reader
+    if _reader is None:
+        print("EasyOCR 초기화 중...")
+        gpu = get_default_device() != 'cpu'
+        _reader = easyocr.Reader(['en'], gpu=gpu)
+        if gpu:
+            # 더미 crop으로 recognizer를 한 번 실행해 첫 배치의 GPU 초기화 비용을 미리 지불
+            _reader.recognize(np.zeros((32, 100), dtype=np.uint8),
+                              horizontal_list=[[0, 100, 0, 32]], free_list=[])
+    return _reader
+
+
+def _align_to_crops(crops: list[tuple], batch_results: list) -> list[tuple[str, float]]:
+    """reader.recognize 결과를 반환된 박스 좌표로 각 크롭에 다시 연결합니다.
+    
+    GPU 배치 경로는 크롭을 y 좌표 순으로 정렬해 인식하므로 결과 순서가 crops 순서와 다를 수 있습니다.
+    같은 사각형이 여러 번 나와도 되도록 좌표별로 크롭 위치 리스트를 둡니다.
+    
+    Returns:
+        crops 순서대로 (text, confidence) 리스트 (결과가 없는 크롭은 ('', 0.0))
+    """
+    positions = {}
+    for pos, (_, _, x_min, y_min, x_max, y_max) in enumerate(crops):
+        positions.setdefault((x_min, y_min, x_max, y_max), []).append(pos)
+    
+    aligned = [('', 0.0)] * len(crops)
+    for box, text, confidence in batch_results:
+        (x_min, y_min), (x_max, y_max) = box[0], box[2]
+        slots = positions.get((int(x_min), int(y_min), int(x_max), int(y_max)))
+        if slots:
+            aligned[slots.pop(0)] = (text.strip(), confidence)
+    return aligned
 
 
 def test_easyocr_and_save(image_path: Path, output_csv: Path, output_image: Path):
@@ -16,13 +55,9 @@ def test_easyocr_and_save(image_path: Path, output_csv: Path, output_image: Path
         print(f"이미지를 읽을 수 없습니다: {image_path}")
         return
     
-    # CRAFT 감지기 초기화
-    print("CRAFT 감지기 초기화 중...")
-    detector = CRAFTDetector()
-    
-    # EasyOCR 초기화
-    print("EasyOCR 초기화 중...")
-    reader = easyocr.Reader(['en'], gpu=False)
+    # CRAFT 감지기 / EasyOCR (캐시된 인스턴스 재사용)
+    detector = get_detector()
+    reader = _get_reader()
     
     # Threshold 설정: text_threshold=0.3, link_threshold=0.15, low_text=0.2
     print("CRAFT 모델로 텍스트 영역 감지 중 (text_threshold=0.3, link_threshold=0.15, low_text=0.2)...")
@@ -40,53 +75,50 @@ def test_easyocr_and_save(image_path: Path, output_csv: Path, output_image: Path
     img_result = image.copy()
     ocr_results = []
     
-    for i, region in enumerate(text_regions):
-        bbox = region['bbox']
-        if isinstance(bbox, list):
-            bbox = np.array(bbox)
-        pts = np.array(bbox, dtype=np.int32)
-        
-        # 박스 영역 크롭
-        x_coords = [p[0] for p in bbox]
-        y_coords = [p[1] for p in bbox]
-        x_min, x_max = max(0, int(min(x_coords)) - 5), min(image.shape[1], int(max(x_coords)) + 5)
-        y_min, y_max = max(0, int(min(y_coords)) - 5), min(image.shape[0], int(max(y_coords)) + 5)
-        
-        cropped = image[y_min:y_max, x_min:x_max]
-        
-        if cropped.size > 0:
-            # EasyOCR로 OCR 수행
-            results = reader.readtext(cropped)
-            
-            if results:
-                text = results[0][1] if results else ''
-                confidence = results[0][2] if results else 0.0
-            else:
-                text = ''
-                confidence = 0.0
-            
-            text = text.strip()
-            
-            if text:
-                # 박스 그리기
-                cv2.polylines(img_result, [pts], True, (0, 255, 0), 2)
-                
-                # 텍스트 표시
-                x, y = int(bbox[0][0]), int(bbox[0][1])
-                display_text = text[:30] if len(text) > 30 else text
-                cv2.putText(img_result, display_text, (x, y - 5),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 3)
-                
-                ocr_results.append({
-                    'index': i + 1,
-                    'text': text,
-                    'confidence': confidence,
-                    'x_min': x_min,
-                    'y_min': y_min,
-                    'x_max': x_max,
-                    'y_max': y_max,
-                    'area': region['area']
-                })
+    # 1단계: 모든 영역의 크롭 좌표를 한 번에 계산 (N, 4, 2) -> 각각 (N,)
+    boxes = np.stack([np.asarray(r['bbox'], dtype=np.int32) for r in text_regions]) \
+        if text_regions else np.zeros((0, 4, 2), dtype=np.int32)
+    x_mins = np.clip(boxes[:, :, 0].min(axis=1) - 5, 0, image.shape[1])
+    x_maxs = np.clip(boxes[:, :, 0].max(axis=1) + 5, 0, image.shape[1])
+    y_mins = np.clip(boxes[:, :, 1].min(axis=1) - 5, 0, image.shape[0])
+    y_maxs = np.clip(boxes[:, :, 1].max(axis=1) + 5, 0, image.shape[0])
+    
+    crops = [
+        (int(i), np.array(text_regions[i]['bbox']), int(x_mins[i]), int(y_mins[i]), int(x_maxs[i]), int(y_maxs[i]))
+        for i in np.flatnonzero((x_maxs > x_mins) & (y_maxs > y_mins))
+    ]
+    
+    # 2단계: 모든 영역을 한 번에 배치 인식 (결과는 박스 좌표로 crops에 연결)
+    batch_results = reader.recognize(
+        image,
+        horizontal_list=[[x_min, x_max, y_min, y_max] for _, _, x_min, y_min, x_max, y_max in crops],
+        free_list=[],
+        batch_size=32
+    ) if crops else []
+    
+    # 3단계: 인식된 영역의 박스는 polylines 한 번에 그리고, 텍스트만 영역별로 표시
+    recognized = []
+    for (i, bbox, x_min, y_min, x_max, y_max), (text, confidence) in zip(crops, _align_to_crops(crops, batch_results)):
+        if text:
+            recognized.append(i)
+            ocr_results.append({
+                'index': i + 1,
+                'text': text,
+                'confidence': confidence,
+                'x_min': x_min,
+                'y_min': y_min,
+                'x_max': x_max,
+                'y_max': y_max,
+                'area': text_regions[i]['area']
+            })
+    
+    if recognized:
+        cv2.polylines(img_result, list(boxes[recognized]), True, (0, 255, 0), 2)
+    
+    font, scale, color, thickness = cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 3
+    anchors = boxes[recognized, 0] - (0, 5)  # 박스 첫 꼭짓점 바로 위
+    for result, (x, y) in zip(ocr_results, anchors.tolist()):
+        cv2.putText(img_result, result['text'][:30], (x, y), font, scale, color, thickness)
     
     # CSV로 저장
     if ocr_results:
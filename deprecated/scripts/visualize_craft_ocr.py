@@ -1,29 +1,106 @@
 """CRAFT로 감지된 박스에 OCR을 수행하고 텍스트를 표시하는 스크립트."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import cv2
 import numpy as np
-from PIL import Image
-import easyocr
-import pytesseract
 
-from src.chart_ocr_processor.craft_detector import CRAFTDetector
+from src.chart_ocr_processor.craft_detector import get_default_device, get_detector
 
+# EasyOCR Reader는 생성 비용이 커서 모듈 단위로 한 번만 생성
+_reader = None
 
-def visualize_craft_with_ocr(image_path: Path, output_path_easyocr: Path, output_path_tesseract: Path):
-    """CRAFT로 감지된 박스에 OCR을 수행하고 텍스트를 표시합니다."""
+# 텍스트 표시용 공통 인자
+_FONT = cv2.FONT_HERSHEY_SIMPLEX
+_FONT_SCALE = 0.7
+_TEXT_COLOR = (0, 0, 255)
+_TEXT_THICKNESS = 3
+
+
+def _get_reader():
+    """모듈 단위로 캐시된 EasyOCR Reader를 반환합니다 (첫 호출 시 import/생성)."""
+    global _reader
+    if _reader is None:
+        import easyocr
+        print("EasyOCR 초기화 중...")
+        gpu = get_default_device() != 'cpu'
+        _reader = easyocr.Reader(['en'], gpu=gpu)
+        if gpu:
+            # 더미 crop으로 recognizer를 한 번 실행해 첫 배치의 GPU 초기화 비용을 미리 지불
+            _reader.recognize(np.zeros((32, 100), dtype=np.uint8),
+                              horizontal_list=[[0, 100, 0, 32]], free_list=[])
+    return _reader
+
+
+def _align_to_crops(crops: list[tuple], batch_results: list) -> list[tuple[str, float]]:
+    """reader.recognize 결과를 반환된 박스 좌표로 각 크롭에 다시 연결합니다.
+    
+    GPU 배치 경로는 크롭을 y 좌표 순으로 정렬해 인식하므로 결과 순서가 crops 순서와 다를 수 있습니다.
+    같은 사각형이 여러 번 나와도 되도록 좌표별로 크롭 위치 리스트를 둡니다.
+    
+    Returns:
+        crops 순서대로 (text, confidence) 리스트 (결과가 없는 크롭은 ('', 0.0))
+    """
+    positions = {}
+    for pos, (_, _, x_min, y_min, x_max, y_max) in enumerate(crops):
+        positions.setdefault((x_min, y_min, x_max, y_max), []).append(pos)
+    
+    aligned = [('', 0.0)] * len(crops)
+    for box, text, confidence in batch_results:
+        (x_min, y_min), (x_max, y_max) = box[0], box[2]
+        slots = positions.get((int(x_min), int(y_min), int(x_max), int(y_max)))
+        if slots:
+            aligned[slots.pop(0)] = (text.strip(), confidence)
+    return aligned
+
+
+def _collect_results(crops: list[tuple], texts: list[str], img_result: np.ndarray | None,
+                     anchors: np.ndarray) -> list[dict]:
+    """인식된 텍스트를 결과 리스트로 정리하고 이미지에 표시합니다.
+    
+    Args:
+        anchors: (N, 2) 정수 배열, 각 영역의 텍스트 표시 기준점 (박스 첫 꼭짓점)
+    """
+    results = []
+    for (i, bbox, x_min, y_min, _, _), text in zip(crops, texts):
+        if not text:
+            continue
+        
+        results.append({
+            'index': i + 1,
+            'text': text,
+            'bbox': bbox,
+            'x': x_min,
+            'y': y_min
+        })
+        
+        x, y = anchors[i]
+        cv2.putText(img_result, text[:30], (int(x), int(y) - 5),
+                    _FONT, _FONT_SCALE, _TEXT_COLOR, _TEXT_THICKNESS)
+    return results
+
+
+def visualize_craft_with_ocr(
+    image_path: Path,
+    output_path_easyocr: Path | None,
+    output_path_tesseract: Path | None
+):
+    """CRAFT로 감지된 박스에 OCR을 수행하고 텍스트를 표시합니다.
+    
+    출력 경로가 None인 엔진은 초기화/실행하지 않습니다.
+    """
     # 이미지 읽기
     image = cv2.imread(str(image_path))
     if image is None:
         print(f"이미지를 읽을 수 없습니다: {image_path}")
         return
     
-    # CRAFT 감지기 초기화
-    detector = CRAFTDetector()
+    use_easyocr = output_path_easyocr is not None
+    use_tesseract = output_path_tesseract is not None
     
-    # EasyOCR 초기화
-    print("EasyOCR 초기화 중...")
-    reader = easyocr.Reader(['en'], gpu=False)
+    # CRAFT 감지기 (캐시된 인스턴스 재사용, OCR 엔진은 필요할 때만 초기화)
+    detector = get_detector()
     
     # Threshold 설정: text_threshold=0.3, link_threshold=0.15, low_text=0.2
     print("CRAFT 모델로 텍스트 영역 감지 중 (text_threshold=0.3, link_threshold=0.15, low_text=0.2)...")
@@ -45,106 +122,71 @@ def visualize_craft_with_ocr(image_path: Path, output_path_easyocr: Path, output
         (0, 255, 255),  # 노란색
     ]
     
-    # EasyOCR 결과
-    print("\n=== EasyOCR 처리 중 ===")
-    img_easyocr = image.copy()
-    ocr_results_easyocr = []
-    
-    for i, region in enumerate(text_regions):
-        bbox = region['bbox']
-        if isinstance(bbox, list):
-            bbox = np.array(bbox)
-        pts = np.array(bbox, dtype=np.int32)
-        color = colors[i % len(colors)]
-        
-        # 박스 그리기
-        cv2.polylines(img_easyocr, [pts], True, color, 2)
-        
-        # 박스 영역 크롭
-        x_coords = [p[0] for p in bbox]
-        y_coords = [p[1] for p in bbox]
-        x_min, x_max = max(0, int(min(x_coords)) - 5), min(image.shape[1], int(max(x_coords)) + 5)
-        y_min, y_max = max(0, int(min(y_coords)) - 5), min(image.shape[0], int(max(y_coords)) + 5)
-        
-        cropped = image[y_min:y_max, x_min:x_max]
-        
-        if cropped.size > 0:
-            # EasyOCR로 OCR 수행 (whitelist 없음)
-            results = reader.readtext(cropped)
-            
-            if results:
-                text = results[0][1] if results else ''
-                confidence = results[0][2] if results else 0.0
-            else:
-                text = ''
-                confidence = 0.0
-            
-            text = text.strip()
-            
-            if text:
-                ocr_results_easyocr.append({
-                    'index': i + 1,
-                    'text': text,
-                    'bbox': bbox,
-                    'x': x_min,
-                    'y': y_min
-                })
-                
-                x, y = int(bbox[0][0]), int(bbox[0][1])
-                display_text = text[:30] if len(text) > 30 else text
-                cv2.putText(img_easyocr, display_text, (x, y - 5),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 3)
-    
-    # Tesseract 결과
-    print("\n=== Tesseract 처리 중 ===")
-    img_tesseract = image.copy()
-    ocr_results_tesseract = []
-    
-    for i, region in enumerate(text_regions):
-        bbox = region['bbox']
-        if isinstance(bbox, list):
-            bbox = np.array(bbox)
-        pts = np.array(bbox, dtype=np.int32)
-        color = colors[i % len(colors)]
-        
-        # 박스 그리기
-        cv2.polylines(img_tesseract, [pts], True, color, 2)
-        
-        # 박스 영역 크롭
-        x_coords = [p[0] for p in bbox]
-        y_coords = [p[1] for p in bbox]
-        x_min, x_max = max(0, int(min(x_coords)) - 5), min(image.shape[1], int(max(x_coords)) + 5)
-        y_min, y_max = max(0, int(min(y_coords)) - 5), min(image.shape[0], int(max(y_coords)) + 5)
-        
-        cropped = image[y_min:y_max, x_min:x_max]
-        
-        if cropped.size > 0:
-            # Tesseract로 OCR 수행 (whitelist 없음)
-            gray = cv2.cvtColor(cropped, cv2.COLOR_BGR2GRAY)
-            pil_image = Image.fromarray(gray)
-            text = pytesseract.image_to_string(pil_image, config='--psm 8')
-            text = text.strip()
-            
-            if text:
-                ocr_results_tesseract.append({
-                    'index': i + 1,
-                    'text': text,
-                    'bbox': bbox,
-                    'x': x_min,
-                    'y': y_min
-                })
-                
-                x, y = int(bbox[0][0]), int(bbox[0][1])
-                display_text = text[:30] if len(text) > 30 else text
-                cv2.putText(img_tesseract, display_text, (x, y - 5),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 3)
+    # 모든 영역의 크롭 좌표를 한 번에 계산 (N, 4, 2) -> 각각 (N,)
+    boxes = np.stack([np.asarray(r['bbox'], dtype=np.int32) for r in text_regions]) \
+        if text_regions else np.zeros((0, 4, 2), dtype=np.int32)
+    x_mins = np.clip(boxes[:, :, 0].min(axis=1) - 5, 0, image.shape[1])
+    x_maxs = np.clip(boxes[:, :, 0].max(axis=1) + 5, 0, image.shape[1])
+    y_mins = np.clip(boxes[:, :, 1].min(axis=1) - 5, 0, image.shape[0])
+    y_maxs = np.clip(boxes[:, :, 1].max(axis=1) + 5, 0, image.shape[0])
+    valid = (x_maxs > x_mins) & (y_maxs > y_mins)
+    
+    # 두 엔진이 같은 좌표/크롭을 공유
+    img_easyocr = image.copy() if use_easyocr else None
+    img_tesseract = image.copy() if use_tesseract else None
+    gray_full = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if use_tesseract else None  # 한 번만 변환
+    
+    # 박스 그리기: 색상별로 묶어 polylines 한 번에 (N번 호출 -> 색상 수만큼)
+    for img in (img_easyocr, img_tesseract):
+        if img is None:
+            continue
+        for c, color in enumerate(colors):
+            contours = list(boxes[c::len(colors)])
+            if contours:
+                cv2.polylines(img, contours, True, color, 2)
+    
+    crops = [
+        (int(i), np.array(text_regions[i]['bbox']), int(x_mins[i]), int(y_mins[i]), int(x_maxs[i]), int(y_maxs[i]))
+        for i in np.flatnonzero(valid)
+    ]
+    
+    # EasyOCR: 모든 영역을 한 번에 배치 인식 (whitelist 없음, 결과는 박스 좌표로 crops에 연결)
+    texts_easyocr = []
+    if use_easyocr and crops:
+        print("\n=== EasyOCR 처리 중 ===")
+        batch_results = _get_reader().recognize(
+            image,
+            horizontal_list=[[x_min, x_max, y_min, y_max] for _, _, x_min, y_min, x_max, y_max in crops],
+            free_list=[],
+            batch_size=32
+        )
+        texts_easyocr = [text for text, _ in _align_to_crops(crops, batch_results)]
+    
+    # Tesseract: 병렬 수행 (pytesseract는 서브프로세스 호출이라 스레드로 충분)
+    # 각 영역은 gray_full의 numpy 슬라이스(뷰)로 복사 없이 전달
+    texts_tesseract = []
+    if use_tesseract and crops:
+        print("\n=== Tesseract 처리 중 ===")
+        import pytesseract
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            texts_tesseract = list(executor.map(
+                lambda c: pytesseract.image_to_string(gray_full[c[3]:c[5], c[2]:c[4]], config='--psm 8').strip(),
+                crops
+            ))
+    
+    # 결과 수집 및 텍스트 표시
+    anchors = boxes[:, 0]
+    ocr_results_easyocr = _collect_results(crops, texts_easyocr, img_easyocr, anchors)
+    ocr_results_tesseract = _collect_results(crops, texts_tesseract, img_tesseract, anchors)
     
     # 저장
-    cv2.imwrite(str(output_path_easyocr), img_easyocr)
-    print(f"\nEasyOCR 시각화 결과를 {output_path_easyocr}에 저장했습니다.")
+    if use_easyocr:
+        cv2.imwrite(str(output_path_easyocr), img_easyocr)
+        print(f"\nEasyOCR 시각화 결과를 {output_path_easyocr}에 저장했습니다.")
     
-    cv2.imwrite(str(output_path_tesseract), img_tesseract)
-    print(f"Tesseract 시각화 결과를 {output_path_tesseract}에 저장했습니다.")
+    if use_tesseract:
+        cv2.imwrite(str(output_path_tesseract), img_tesseract)
+        print(f"Tesseract 시각화 결과를 {output_path_tesseract}에 저장했습니다.")
     
     # EasyOCR 결과 출력
     print(f"\n=== EasyOCR 결과 (총 {len(ocr_results_easyocr)}개) ===")
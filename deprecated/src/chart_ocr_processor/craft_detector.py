@@ -1,5 +1,7 @@
 """CRAFT (Character Region Awareness for Text detection) 모델을 사용한 텍스트 영역 감지."""
 
+import contextlib
+import hashlib
 import os
 from pathlib import Path
 from typing import List, Tuple, Optional
@@ -8,26 +10,51 @@ import urllib.request
 import cv2
 import numpy as np
 import torch
+from PIL import Image
+from torch.nn.modules.utils import consume_prefix_in_state_dict_if_present
 
 # CRAFT 모델 import
 from .craft import CRAFT
 from . import craft_utils
 from . import imgproc
 
+# 리사이즈 후 입력 크기가 고정되므로 cuDNN이 가장 빠른 커널을 선택하도록 함
+torch.backends.cudnn.benchmark = True
+
+# 다운로드 청크 크기 (1 MB)
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# 감지 결과 디스크 캐시 (None이면 비활성화) 및 최대 크기 (초과 시 오래 사용하지 않은 항목부터 삭제)
+CACHE_DIR: Optional[Path] = Path.home() / '.cache' / 'craft'
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+def get_default_device() -> str:
+    """사용 가능한 가장 빠른 디바이스를 반환합니다 ('cuda' > 'mps' > 'cpu')."""
+    if torch.cuda.is_available():
+        return 'cuda'
+    if torch.backends.mps.is_available():
+        return 'mps'
+    return 'cpu'
+
 
 class CRAFTDetector:
     """CRAFT 모델을 사용하여 텍스트 영역을 감지합니다."""
     
-    def __init__(self, model_path: Optional[Path] = None, device: str = 'cpu'):
+    # 가중치 파일의 SHA-256 (지정하면 다운로드 후 검증, None이면 검증 생략)
+    MODEL_SHA256: Optional[str] = None
+    
+    def __init__(self, model_path: Optional[Path] = None, device: Optional[str] = None):
         """CRAFT 감지기 초기화.
         
         Args:
             model_path: CRAFT 모델 가중치 파일 경로 (None이면 자동 다운로드)
-            device: 사용할 디바이스 ('cpu' 또는 'cuda')
+            device: 사용할 디바이스 ('cpu', 'cuda', 'mps'; None이면 자동 감지)
         """
-        self.device = torch.device(device)
+        self.device = torch.device(device or get_default_device())
         self.model_path = model_path or self._get_default_model_path()
         self.model = None
+        self._dtype = torch.float32
         self._load_model()
     
     def _get_default_model_path(self) -> Path:
@@ -42,24 +69,54 @@ class CRAFTDetector:
         model_dir.mkdir(exist_ok=True)
         return model_dir / 'craft_mlt_25k.pth'
     
-    def _download_model(self, url: str, save_path: Path):
-        """모델을 다운로드합니다."""
+    def _download_model(self, url: str, save_path: Path, expected_sha256: Optional[str] = None):
+        """모델을 스트리밍으로 다운로드합니다.
+        
+        URL별 .tmp 파일에 청크 단위로 저장하고 완료 후 rename합니다.
+        이전에 받다 만 .tmp가 있으면 Range 요청으로 이어받습니다.
+        SHA-256은 다운로드 중에 계산하므로 검증을 위한 추가 읽기가 없습니다.
+        """
         print(f"Downloading CRAFT model from {url}...")
-        urllib.request.urlretrieve(url, save_path)
-        print(f"Model saved to {save_path}")
-    
-    def _copy_state_dict(self, state_dict):
-        """State dict 복사 (DataParallel 대응)."""
-        from collections import OrderedDict
-        if list(state_dict.keys())[0].startswith("module"):
-            start_idx = 1
-        else:
-            start_idx = 0
-        new_state_dict = OrderedDict()
-        for k, v in state_dict.items():
-            name = ".".join(k.split(".")[start_idx:])
-            new_state_dict[name] = v
-        return new_state_dict
+        url_tag = hashlib.md5(url.encode()).hexdigest()[:8]
+        tmp_path = save_path.with_name(f"{save_path.name}.{url_tag}.tmp")
+        headers = {'User-Agent': 'Mozilla/5.0'}
+        
+        # 이어받기: 기존 부분은 해시에 먼저 반영
+        hasher = hashlib.sha256()
+        downloaded = 0
+        if tmp_path.exists():
+            with open(tmp_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(_DOWNLOAD_CHUNK_SIZE), b''):
+                    hasher.update(chunk)
+            downloaded = tmp_path.stat().st_size
+        
+        # HEAD로 전체 크기 확인 (이미 다 받았으면 GET 생략)
+        head = urllib.request.Request(url, method='HEAD', headers=headers)
+        with urllib.request.urlopen(head, timeout=30) as response:
+            total = int(response.headers.get('Content-Length') or 0)
+        
+        if not total or downloaded < total:
+            if downloaded:
+                headers['Range'] = f'bytes={downloaded}-'
+            req = urllib.request.Request(url, headers=headers)
+            with urllib.request.urlopen(req, timeout=30) as response:
+                if downloaded and response.status != 206:
+                    # 서버가 Range를 무시하면 처음부터 다시 받음
+                    hasher = hashlib.sha256()
+                    downloaded = 0
+                with open(tmp_path, 'ab' if downloaded else 'wb') as f:
+                    for chunk in iter(lambda: response.read(_DOWNLOAD_CHUNK_SIZE), b''):
+                        f.write(chunk)
+                        hasher.update(chunk)
+                        downloaded += len(chunk)
+        
+        digest = hasher.hexdigest()
+        if expected_sha256 and digest != expected_sha256:
+            tmp_path.unlink()
+            raise ValueError(f"Checksum mismatch for {url}: {digest}")
+        
+        tmp_path.replace(save_path)
+        print(f"Model saved to {save_path} ({downloaded / (1 << 20):.1f} MB, sha256={digest})")
     
     def _load_model(self):
         """CRAFT 모델을 로드합니다."""
@@ -73,7 +130,7 @@ class CRAFTDetector:
             downloaded = False
             for model_url in model_urls:
                 try:
-                    self._download_model(model_url, self.model_path)
+                    self._download_model(model_url, self.model_path, self.MODEL_SHA256)
                     downloaded = True
                     break
                 except Exception as e:
@@ -93,15 +150,38 @@ class CRAFTDetector:
         
         # 가중치 로드
         print(f"Loading CRAFT model from {self.model_path}")
-        if self.device.type == 'cuda':
-            state_dict = torch.load(str(self.model_path))
-        else:
-            state_dict = torch.load(str(self.model_path), map_location='cpu')
+        state_dict = torch.load(str(self.model_path), map_location=self.device, weights_only=True)
         
-        self.model.load_state_dict(self._copy_state_dict(state_dict))
+        # DataParallel로 저장된 가중치의 'module.' 접두사 제거 (in-place)
+        consume_prefix_in_state_dict_if_present(state_dict, 'module.')
+        self.model.load_state_dict(state_dict)
         self.model.to(self.device)
         self.model.eval()
+        
+        # GPU에서는 FP16으로 추론 (VGG 기반 CRAFT는 연산량이 커서 효과가 큼)
+        if self.device.type == 'cuda':
+            self.model.half()
+            self._dtype = torch.float16
+            # cuDNN 컨볼루션은 channels_last 레이아웃에서 더 빠름
+            self.model = self.model.to(memory_format=torch.channels_last)
         print("CRAFT model loaded successfully")
+        self._warmup()
+    
+    def _warmup(self, canvas_size: int = 1280):
+        """더미 입력으로 한 번 forward하여 첫 이미지의 cuDNN 오토튜닝/커널 초기화 비용을 미리 지불합니다.
+        
+        Args:
+            canvas_size: 더미 입력의 한 변 크기 (detect_text_regions의 canvas_size와 동일하게)
+        """
+        if self.device.type == 'cpu':
+            return  # CPU는 오토튜닝이 없어 워밍업 이득이 없음
+        x = torch.zeros(1, 3, canvas_size, canvas_size, device=self.device, dtype=self._dtype)
+        if self.device.type == 'cuda':
+            x = x.contiguous(memory_format=torch.channels_last)
+        with torch.inference_mode():
+            self.model(x)
+        if self.device.type == 'cuda':
+            torch.cuda.synchronize()
     
     def detect_text_regions(
         self, 
@@ -133,6 +213,14 @@ class CRAFTDetector:
         if self.model is None:
             raise RuntimeError("CRAFT model not loaded")
         
+        # 동일 이미지/파라미터의 결과가 캐시에 있으면 forward pass 생략
+        # (장치/정밀도에 따라 히트맵이 달라지므로 키에 포함: CUDA FP16 vs CPU/MPS FP32)
+        cache_path = _cache_path(image, (text_threshold, link_threshold, low_text, canvas_size, mag_ratio,
+                                         self.device.type, str(self._dtype)))
+        cached = _load_cached(cache_path)
+        if cached is not None:
+            return cached
+        
         # 이미지 전처리
         img_resized, target_ratio, size_heatmap = imgproc.resize_aspect_ratio(
             image, canvas_size, interpolation=cv2.INTER_LINEAR, mag_ratio=mag_ratio
@@ -142,15 +230,26 @@ class CRAFTDetector:
         # 정규화
         x = imgproc.normalizeMeanVariance(img_resized)
         x = torch.from_numpy(x).permute(2, 0, 1)  # [h, w, c] to [c, h, w]
-        x = x.unsqueeze(0).to(self.device)  # [c, h, w] to [b, c, h, w]
+        x = x.unsqueeze(0)  # [c, h, w] to [b, c, h, w]
+        if self.device.type == 'cuda':
+            # pinned memory로 비동기 H2D 복사
+            x = x.pin_memory().to(self.device, non_blocking=True)
+            x = x.contiguous(memory_format=torch.channels_last)
+        else:
+            x = x.to(self.device)
+        if self._dtype == torch.float16:
+            x = x.half()
         
-        # Forward pass
-        with torch.no_grad():
+        # Forward pass (autocast는 CUDA에서만; 구버전 torch는 mps 등의 device_type에서 enabled=False여도 예외 발생)
+        autocast = torch.autocast('cuda', dtype=torch.float16) if self.device.type == 'cuda' \
+            else contextlib.nullcontext()
+        with torch.inference_mode(), autocast:
             y, _ = self.model(x)
+        y = y.float()  # getDetBoxes는 FP32 입력 기준
         
         # Region Score와 Affinity Score 추출
-        score_text = y[0, :, :, 0].cpu().data.numpy()  # Region Score
-        score_link = y[0, :, :, 1].cpu().data.numpy()   # Affinity Score
+        score_text = y[0, :, :, 0].detach().cpu().numpy()  # Region Score
+        score_link = y[0, :, :, 1].detach().cpu().numpy()   # Affinity Score
         
         # 박스 추출
         boxes, _ = craft_utils.getDetBoxes(
@@ -160,45 +259,161 @@ class CRAFTDetector:
         # 좌표 조정
         boxes = craft_utils.adjustResultCoordinates(boxes, ratio_w, ratio_h)
         
-        # 결과 변환
-        results = []
-        for box in boxes:
-            # 박스 면적 계산
-            w = np.linalg.norm(box[0] - box[1])
-            h = np.linalg.norm(box[1] - box[2])
-            area = w * h
-            
-            # 필터링 완화 (작은 글씨와 큰 글씨 모두 포함)
-            if area < 10:  # 매우 작은 노이즈만 제거
-                continue
-            
-            results.append({
-                'bbox': box.tolist(),
-                'score': 0.8,  # CRAFT 점수는 별도로 계산 가능
-                'area': area
-            })
+        # 박스 면적 계산 (N개 박스를 한 번에)
+        b = np.asarray(boxes, dtype=np.float32).reshape(-1, 4, 2)
+        w = np.linalg.norm(b[:, 0] - b[:, 1], axis=1)
+        h = np.linalg.norm(b[:, 1] - b[:, 2], axis=1)
+        areas = w * h
         
-        # 작은 영역 우선 정렬
-        results.sort(key=lambda x: x['area'])
+        # 필터링 완화 (매우 작은 노이즈만 제거) 후 작은 영역 우선 정렬
+        mask = areas >= 10
+        b, areas = b[mask], areas[mask]
+        order = np.argsort(areas, kind='stable')
+        b, areas = b[order], areas[order]
+        
+        _save_cached(cache_path, b, areas, score_text, score_link)
+        results = _to_results(b, areas)
         
         # Region Score와 Affinity Score 맵을 결과에 포함
         return results, score_text, score_link
 
 
-def detect_text_with_craft(image_path: Path, device: str = 'cpu') -> tuple[List[dict], np.ndarray, np.ndarray]:
+def _cache_path(image: np.ndarray, params: tuple) -> Optional[Path]:
+    """이미지 내용과 감지 파라미터로 캐시 파일 경로를 만듭니다."""
+    if CACHE_DIR is None:
+        return None
+    h = hashlib.blake2b(image.tobytes(), digest_size=16)
+    h.update(repr((image.shape, image.dtype.str, params)).encode())
+    return CACHE_DIR / f"{h.hexdigest()}.npz"
+
+
+def _load_cached(path: Optional[Path]) -> Optional[tuple[List[dict], np.ndarray, np.ndarray]]:
+    """캐시된 감지 결과를 읽습니다 (없거나 손상되었으면 None)."""
+    if path is None or not path.exists():
+        return None
+    try:
+        with np.load(path) as data:
+            boxes, areas = data['boxes'], data['areas']
+            score_text, score_link = data['score_text'], data['score_link']
+    except (OSError, ValueError, KeyError):
+        path.unlink(missing_ok=True)
+        return None
+    os.utime(path)  # LRU 정리를 위해 최근 사용 시각 갱신
+    return _to_results(boxes, areas), score_text, score_link
+
+
+def _to_results(boxes: np.ndarray, areas: np.ndarray) -> List[dict]:
+    """(N, 4, 2) 박스 배열과 면적을 결과 딕셔너리 리스트로 변환합니다."""
+    # CRAFT 점수는 별도로 계산 가능
+    return [
+        {'bbox': box.tolist(), 'score': 0.8, 'area': float(area)}
+        for box, area in zip(boxes, areas)
+    ]
+
+
+def _save_cached(path: Optional[Path], boxes: np.ndarray, areas: np.ndarray,
+                 score_text: np.ndarray, score_link: np.ndarray):
+    """감지 결과를 캐시에 저장하고 최대 크기를 넘으면 오래된 항목을 정리합니다."""
+    if path is None:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+    np.savez_compressed(tmp_path, boxes=boxes, areas=areas, score_text=score_text, score_link=score_link)
+    tmp_path.replace(path)
+    _sweep_cache(path.parent)
+
+
+def _sweep_cache(cache_dir: Path):
+    """캐시 디렉토리 크기가 CACHE_MAX_BYTES를 넘지 않도록 가장 오래 사용하지 않은 파일부터 삭제합니다."""
+    entries = []
+    for f in cache_dir.glob('*.npz'):
+        try:
+            st = f.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_mtime, st.st_size, f))
+    total = sum(size for _, size, _ in entries)
+    for _, size, f in sorted(entries):
+        if total <= CACHE_MAX_BYTES:
+            break
+        f.unlink(missing_ok=True)
+        total -= size
+
+
+# (모델 경로, 디바이스)별로 로드된 감지기를 캐시 (모델 로드는 프로세스당 한 번)
+_DETECTOR_CACHE: dict[tuple[str, str], CRAFTDetector] = {}
+
+
+def get_detector(model_path: Optional[Path] = None, device: Optional[str] = None) -> CRAFTDetector:
+    """캐시된 CRAFT 감지기를 반환합니다 (없으면 생성).
+    
+    Args:
+        model_path: CRAFT 모델 가중치 파일 경로 (None이면 기본 경로)
+        device: 사용할 디바이스 ('cpu', 'cuda', 'mps'; None이면 자동 감지)
+        
+    Returns:
+        CRAFTDetector 인스턴스
+    """
+    device = device or get_default_device()
+    key = (str(model_path) if model_path else '', device)
+    if key not in _DETECTOR_CACHE:
+        _DETECTOR_CACHE[key] = CRAFTDetector(model_path=model_path, device=device)
+    return _DETECTOR_CACHE[key]
+
+
+# 축소 읽기 배율별 cv2 플래그 (큰 배율부터 시도)
+_REDUCED_READ_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+
+
+def _read_image_for_craft(image_path: Path, canvas_size: int = 1280, mag_ratio: float = 1.5) -> tuple[Optional[np.ndarray], int]:
+    """CRAFT 입력 해상도에 필요한 만큼만 디코딩하여 이미지를 읽습니다.
+    
+    resize_aspect_ratio는 긴 변을 canvas_size로 제한하므로, 원본이 그보다 충분히 크면
+    축소 디코딩(IMREAD_REDUCED_COLOR_*)으로 읽어도 결과 해상도가 같습니다.
+    
+    Args:
+        image_path: 이미지 파일 경로
+        canvas_size: detect_text_regions의 캔버스 크기
+        mag_ratio: detect_text_regions의 확대 비율
+        
+    Returns:
+        (이미지 또는 None, 축소 배율)
+    """
+    try:
+        with Image.open(image_path) as img:  # 헤더만 읽어 크기 확인
+            long_side = max(img.size)
+    except OSError:
+        long_side = 0
+    
+    for factor, flag in _REDUCED_READ_FLAGS:
+        if long_side / factor * mag_ratio >= canvas_size:
+            return cv2.imread(str(image_path), flag), factor
+    return cv2.imread(str(image_path)), 1
+
+
+def detect_text_with_craft(image_path: Path, device: Optional[str] = None) -> tuple[List[dict], np.ndarray, np.ndarray]:
     """CRAFT를 사용하여 이미지에서 텍스트 영역을 감지합니다.
     
     Args:
         image_path: 이미지 파일 경로
-        device: 사용할 디바이스 ('cpu' 또는 'cuda')
+        device: 사용할 디바이스 ('cpu', 'cuda', 'mps'; None이면 자동 감지)
         
     Returns:
         (텍스트 영역 정보 리스트, Region Score 맵, Affinity Score 맵)
     """
-    detector = CRAFTDetector(device=device)
-    image = cv2.imread(str(image_path))
+    detector = get_detector(device=device)
+    image, factor = _read_image_for_craft(image_path)
     if image is None:
         raise ValueError(f"이미지를 읽을 수 없습니다: {image_path}")
     
-    return detector.detect_text_regions(image)
-
+    results, score_text, score_link = detector.detect_text_regions(image)
+    if factor > 1:
+        # 축소 읽기한 좌표를 원본 이미지 좌표로 복원
+        for r in results:
+            r['bbox'] = [[x * factor, y * factor] for x, y in r['bbox']]
+            r['area'] *= factor * factor
+    return results, score_text, score_link
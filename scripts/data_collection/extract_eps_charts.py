@@ -5,6 +5,8 @@ This script provides a command-line interface to extract chart pages from PDFs.
 For programmatic use, import from the main package:
     from factset_report_analyzer import extract_charts
 """
+import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -17,26 +19,34 @@ from src.factset_report_analyzer import extract_charts
 
 def main() -> None:
     """CLI entry point for chart extraction."""
+    parser = argparse.ArgumentParser(description="Extract EPS chart pages from FactSet PDFs")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes for PDF parsing (default: CPU count)")
+    args = parser.parse_args()
+    
     # Default paths
     pdf_dir = PROJECT_ROOT / "output" / "factset_pdfs"
     output_dir = PROJECT_ROOT / "output" / "estimates"
     
     print("=" * 80)
     print("EPS Chart Extractor (CLI)")
-print("=" * 80)
+    print("=" * 80)
     print()
     
     # Get PDF files
-    pdf_files = sorted(pdf_dir.glob("*.pdf"), reverse=True)
+    pdf_files = sorted(pdf_dir.glob("*.pdf"), key=lambda p: p.name, reverse=True)
                 
     if not pdf_files:
         print(f"⚠️  No PDF files found in {pdf_dir}")
         print(f"   Please run 'uv run python scripts/data_collection/download_factset_pdfs.py' first.")
         return
     
-    # Extract charts
-    charts = extract_charts(pdf_files, outpath=output_dir)
-                    
+    # Extract charts (returned in memory) and write them to output_dir
+    charts = extract_charts(pdf_files, workers=args.workers)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for name, image_bytes in charts:
+        (output_dir / name).write_bytes(image_bytes)
+    
     print()
     print("=" * 80)
     print(f"✅ Complete: {len(charts)} charts extracted to {output_dir}")
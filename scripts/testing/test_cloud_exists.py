@@ -0,0 +1,97 @@
+"""Tests for batched existence checks against cloud storage."""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.factset_report_analyzer.utils import cloudflare
+
+
+class _StubPaginator:
+    """list_objects_v2 paginator over a fixed key set; listing prefixes in `failing` raises."""
+    
+    def __init__(self, client):
+        self.client = client
+    
+    def paginate(self, Bucket, Prefix, PaginationConfig):
+        self.client.listed.append(Prefix)
+        if Prefix in self.client.failing:
+            raise RuntimeError("listing failed")
+        keys = sorted(k for k in self.client.keys if k.startswith(Prefix))
+        # Two pages, the last one without 'Contents' when empty
+        return [{'Contents': [{'Key': k} for k in keys[:1]]}, {'Contents': [{'Key': k} for k in keys[1:]]} if keys[1:] else {}]
+
+
+class _StubClient:
+    """Minimal S3 client recording list and HEAD requests."""
+    
+    def __init__(self, keys, failing=()):
+        self.keys = set(keys)
+        self.failing = set(failing)
+        self.listed = []
+        self.heads = []
+    
+    def get_paginator(self, name):
+        assert name == 'list_objects_v2'
+        return _StubPaginator(self)
+    
+    def head_object(self, Bucket, Key):
+        self.heads.append(Key)
+        if Key not in self.keys:
+            raise RuntimeError("404")
+        return {}
+
+
+def _check(client, paths):
+    with patch.object(cloudflare, '_get_s3_client', return_value=client):
+        return cloudflare.files_exist_in_cloud(paths)
+
+
+def test_groups_paths_by_directory():
+    """Each directory is listed once and no HEAD requests are sent."""
+    client = _StubClient({'reports/a.pdf', 'reports/c.pdf', 'estimates/x.png', 'other/z.png'})
+    paths = ['reports/a.pdf', 'estimates/y.png', 'reports/b.pdf', 'estimates/x.png', 'reports/c.pdf']
+    
+    result = _check(client, paths)
+    
+    assert list(result) == paths
+    assert result == {
+        'reports/a.pdf': True,
+        'estimates/y.png': False,
+        'reports/b.pdf': False,
+        'estimates/x.png': True,
+        'reports/c.pdf': True,
+    }
+    assert sorted(client.listed) == ['estimates/', 'reports/']
+    assert client.heads == []
+
+
+def test_root_keys_use_head_requests():
+    """Root-level paths are checked individually instead of listing the whole bucket."""
+    client = _StubClient({'extracted_estimates.csv', 'reports/a.pdf'})
+    
+    result = _check(client, ['extracted_estimates.csv', 'missing.csv', 'reports/a.pdf'])
+    
+    assert result == {'extracted_estimates.csv': True, 'missing.csv': False, 'reports/a.pdf': True}
+    assert '' not in client.listed
+    assert sorted(client.heads) == ['extracted_estimates.csv', 'missing.csv']
+
+
+def test_failed_listing_falls_back_to_head_requests():
+    """A failed listing does not report its paths as missing."""
+    client = _StubClient({'reports/a.pdf', 'estimates/x.png'}, failing={'reports/'})
+    
+    result = _check(client, ['reports/a.pdf', 'reports/b.pdf', 'estimates/x.png'])
+    
+    assert result == {'reports/a.pdf': True, 'reports/b.pdf': False, 'estimates/x.png': True}
+    assert sorted(client.heads) == ['reports/a.pdf', 'reports/b.pdf']
+
+
+def test_without_client():
+    """Without cloud storage every path is reported missing; no paths gives an empty dict."""
+    with patch.object(cloudflare, '_get_s3_client', return_value=None):
+        assert cloudflare.files_exist_in_cloud(['reports/a.pdf']) == {'reports/a.pdf': False}
+        assert cloudflare.files_exist_in_cloud([]) == {}
@@ -7,7 +7,7 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.factset_report_analyzer.core.ocr.google_vision_processor import extract_text_with_boxes
+from src.factset_report_analyzer.core.ocr.google_vision_processor import cached_extract_text_with_boxes
 from src.factset_report_analyzer.core.ocr.coordinate_matcher import (
     match_quarters_with_numbers,
     find_quarters_at_bottom,
@@ -31,7 +31,7 @@ def test_coordinate_matching():
     print(f"Processing image: {image_path}")
     
     # Get OCR results
-    ocr_results = extract_text_with_boxes(image_path)
+    ocr_results = cached_extract_text_with_boxes(image_path)
     print(f"OCR results: {len(ocr_results)} text regions")
     
     # Find Q patterns at bottom
@@ -40,6 +40,15 @@ def test_coordinate_matching():
     for qb in quarter_boxes[:5]:
         print(f"  - {qb['quarter']}: '{qb['text']}' (y:{qb['top']})")
     
+    # Parse each box once: only non-quarter boxes with a number can be candidates
+    number_boxes = []
+    for box in ocr_results:
+        if extract_quarter_pattern(box['text']) is not None:
+            continue
+        number = extract_number(box['text'])
+        if number is not None:
+            number_boxes.append((box, number))
+    
     # Check number candidates around each Q box
     print(f"\n=== Checking Number Candidates ===")
     for qb in quarter_boxes[:3]:
@@ -47,14 +56,9 @@ def test_coordinate_matching():
         # Find all number candidates in the same y range
         y_tolerance = 50.0  # Wider tolerance
         candidates = []
-        for box in ocr_results:
+        for box, number in number_boxes:
             if (box['left'] == qb['left'] and box['top'] == qb['top']):
                 continue
-            if extract_quarter_pattern(box['text']) is not None:
-                continue
-            number = extract_number(box['text'])
-            if number is None:
-                continue
             if is_same_y_range(qb, box, y_tolerance):
                 distance = calculate_distance(qb, box)
                 candidates.append({
@@ -0,0 +1,62 @@
+"""Tests for the vectorized 4-quarter EPS sum used by SP500."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.factset_report_analyzer.analysis.sp500 import calculate_eps_sum
+
+
+def _eps_table() -> pd.DataFrame:
+    """Three reports (deliberately unsorted) with '*' estimates, gaps and a negative value.
+    
+    Quarters before Q4'23 and after Q1'25 have no column at all.
+    """
+    return pd.DataFrame({
+        'Report_Date': pd.to_datetime(['2024-02-02', '2024-01-05', '2024-04-05']),
+        "Q4'23": [np.nan, 48.0, np.nan],
+        "Q1'24": ['50.5*', '50*', '49'],
+        "Q2'24": [np.nan, 51.0, 51.0],
+        "Q3'24": [52.5, 52.0, np.nan],
+        "Q4'24": [53.0, 53.0, 53.0],
+        "Q1'25": [54.0, np.nan, -300.0],
+    })
+
+
+def test_forward_eps_sum():
+    """Forward sums use the latest report on or before each date, carrying earlier values forward."""
+    dates = pd.Series(pd.to_datetime([
+        '2023-12-29',  # before the first report
+        '2024-01-10',  # 2024-01-05 report: 50 + 51 + 52 + 53
+        '2024-02-10',  # 2024-02-02 report: 50.5 + 51 (carried) + 52.5 + 53
+        '2024-04-10',  # 2024-04-05 report: 51 + 52.5 (carried) + 53 - 300 <= 0
+        '2025-01-15',  # Q2'25 and later have no column
+    ]), index=[10, 11, 12, 13, 14])
+    
+    result = calculate_eps_sum(_eps_table(), dates, 'forward')
+    
+    assert list(result.index) == [10, 11, 12, 13, 14]
+    np.testing.assert_allclose(result.to_numpy(), [np.nan, 206.0, 207.0, np.nan, np.nan])
+
+
+def test_trailing_eps_sum():
+    """Trailing sums cover the four quarters before the date's quarter."""
+    dates = pd.Series(pd.to_datetime([
+        '2024-02-10',  # Q1'23..Q3'23 have no column
+        '2024-10-15',  # 48 (carried from the first report) + 49 + 51 + 52.5
+    ]))
+    
+    result = calculate_eps_sum(_eps_table(), dates, 'trailing')
+    
+    np.testing.assert_allclose(result.to_numpy(), [np.nan, 200.5])
+
+
+def test_empty_dates():
+    """No dates gives an empty result instead of failing."""
+    result = calculate_eps_sum(_eps_table(), pd.Series([], dtype='datetime64[ns]'), 'forward')
+    assert result.empty
@@ -2,13 +2,14 @@
 
 import sys
 import cv2
+import numpy as np
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.factset_report_analyzer.core.ocr.google_vision_processor import extract_text_with_boxes
+from src.factset_report_analyzer.core.ocr.google_vision_processor import cached_extract_text_with_boxes
 from src.factset_report_analyzer.core.ocr.coordinate_matcher import match_quarters_with_numbers
 from src.factset_report_analyzer.core.ocr.bar_classifier import classify_all_bars
 
@@ -18,15 +19,16 @@ def test_multiple_methods():
     # Set image path (not a pytest fixture, just a local variable)
     image_path = Path('output/estimates/20161209-6.png')
     
-    # Read image
-    image = cv2.imread(str(image_path))
+    # Read image once: the bytes go to Vision, the decoded array to OpenCV
+    raw = image_path.read_bytes() if image_path.exists() else b''
+    image = cv2.imdecode(np.frombuffer(raw, np.uint8), cv2.IMREAD_COLOR) if raw else None
     if image is None:
         print(f"Test image not found: {image_path}")
         return
     
     # OCR and matching
     print("Performing OCR and matching...")
-    ocr_results = extract_text_with_boxes(image_path)
+    ocr_results = cached_extract_text_with_boxes(image_path, content=raw)
     matched_results = match_quarters_with_numbers(ocr_results)
     print(f"Total {len(matched_results)} matches completed\n")
     
@@ -3,22 +3,23 @@
 import cv2
 import numpy as np
 from pathlib import Path
-from src.factset_report_analyzer.core.ocr.google_vision_processor import extract_text_with_boxes
+from src.factset_report_analyzer.core.ocr.google_vision_processor import cached_extract_text_with_boxes
 from src.factset_report_analyzer.core.ocr.coordinate_matcher import match_quarters_with_numbers
 from src.factset_report_analyzer.core.ocr.bar_classifier import classify_all_bars, get_bar_region_coordinates
 
 
 def visualize_classification_results(image_path: Path, output_path: Path):
     """Visualize bar graph classification results."""
-    # Read image
-    image = cv2.imread(str(image_path))
+    # Read image once: the bytes go to Vision, the decoded array to OpenCV
+    raw = image_path.read_bytes() if image_path.exists() else b''
+    image = cv2.imdecode(np.frombuffer(raw, np.uint8), cv2.IMREAD_COLOR) if raw else None
     if image is None:
         print(f"Cannot read image: {image_path}")
         return
     
     # OCR and matching
     print("Performing OCR and matching...")
-    ocr_results = extract_text_with_boxes(image_path)
+    ocr_results = cached_extract_text_with_boxes(image_path, content=raw)
     matched_results = match_quarters_with_numbers(ocr_results)
     print(f"Total {len(matched_results)} matches completed")
     
@@ -3,13 +3,16 @@
 import cv2
 import numpy as np
 from pathlib import Path
-from src.factset_report_analyzer.core.ocr.google_vision_processor import extract_text_with_boxes
+from src.factset_report_analyzer.core.ocr.google_vision_processor import cached_extract_text_with_boxes
 from src.factset_report_analyzer.core.ocr.coordinate_matcher import match_quarters_with_numbers
+from src.factset_report_analyzer.core.ocr.bar_classifier import classify_all_bars
 
+# CLAHE operator is stateless across images, so create it once
+_CLAHE = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
 
-def apply_preprocessing_to_bar(image: np.ndarray, q_box: dict, num_box: dict) -> dict:
-    """Apply various preprocessing techniques to bar graph region."""
-    # Define bar graph region
+
+def _bar_region(image: np.ndarray, q_box: dict, num_box: dict) -> tuple[int, int, int, int]:
+    """Return (x_min, x_max, y_top, y_bottom) of the bar between a Q box and its number."""
     q_center_x = q_box['left'] + q_box['width'] / 2
     num_center_x = num_box['left'] + num_box['width'] / 2
     x_center = int((q_center_x + num_center_x) / 2)
@@ -20,6 +23,14 @@ def apply_preprocessing_to_bar(image: np.ndarray, q_box: dict, num_box: dict) ->
     y_top = int(num_box['top'] + num_box['height'])
     y_bottom = int(q_box['top'])
     
+    return x_min, x_max, y_top, y_bottom
+
+
+def apply_preprocessing_to_bar(image: np.ndarray, q_box: dict, num_box: dict) -> dict:
+    """Apply various preprocessing techniques to bar graph region."""
+    # Define bar graph region
+    x_min, x_max, y_top, y_bottom = _bar_region(image, q_box, num_box)
+    
     # Crop region
     cropped = image[y_top:y_bottom, x_min:x_max]
     
@@ -38,9 +49,8 @@ def apply_preprocessing_to_bar(image: np.ndarray, q_box: dict, num_box: dict) ->
     _, otsu_binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
     results['otsu'] = otsu_binary
     
-    # OTSU binarization (inverted)
-    _, otsu_binary_inv = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
-    results['otsu_inv'] = otsu_binary_inv
+    # OTSU binarization (inverted): same threshold, so just the complement
+    results['otsu_inv'] = cv2.bitwise_not(otsu_binary)
     
     # Adaptive threshold
     adaptive_thresh = cv2.adaptiveThreshold(
@@ -49,8 +59,7 @@ def apply_preprocessing_to_bar(image: np.ndarray, q_box: dict, num_box: dict) ->
     results['adaptive'] = adaptive_thresh
     
     # CLAHE
-    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-    clahe_gray = clahe.apply(gray)
+    clahe_gray = _CLAHE.apply(gray)
     results['clahe'] = clahe_gray
     
     # Histogram equalization
@@ -72,16 +81,29 @@ def apply_preprocessing_to_bar(image: np.ndarray, q_box: dict, num_box: dict) ->
     return results
 
 
-def visualize_all_bars_preprocessing(image_path: Path, output_dir: Path):
-    """Apply preprocessing to all bar graphs and save results."""
-    image = cv2.imread(str(image_path))
+def visualize_all_bars_preprocessing(image_path: Path, output_dir: Path, fast_mode: bool = False):
+    """Apply preprocessing to all bar graphs and save results.
+    
+    With fast_mode, intermediate PNGs are skipped and only the label the
+    pipeline assigns to each bar (classify_all_bars) is printed.
+    """
+    # Read the file once: the bytes go to Vision, the decoded array to OpenCV
+    raw = image_path.read_bytes() if image_path.exists() else b''
+    image = cv2.imdecode(np.frombuffer(raw, np.uint8), cv2.IMREAD_COLOR) if raw else None
     if image is None:
         print(f"Cannot read image: {image_path}")
         return
     
-    ocr_results = extract_text_with_boxes(image_path)
+    ocr_results = cached_extract_text_with_boxes(image_path, content=raw)
     matched_results = match_quarters_with_numbers(ocr_results)
     
+    if fast_mode:
+        # Same classifier and thresholds as the pipeline (preprocessing runs once per image)
+        for result in classify_all_bars(image, matched_results):
+            print(f"{result['quarter']}: {result['bar_color']} "
+                  f"(confidence: {result['bar_confidence']}, votes: {result['bar_votes']})")
+        return
+    
     output_dir.mkdir(parents=True, exist_ok=True)
     
     print(f"Processing {len(matched_results)} bar graphs...\n")
@@ -94,9 +116,13 @@ def visualize_all_bars_preprocessing(image_path: Path, output_dir: Path):
         preprocessed = apply_preprocessing_to_bar(image, q_box, num_box)
         
         if preprocessed:
-            for method, processed_img in preprocessed.items():
-                output_path = output_dir / f"bar_{quarter}_{method}.png"
-                cv2.imwrite(str(output_path), processed_img)
+            # One montage per bar (variants left to right in dict order) instead of a file per variant
+            montage = np.hstack([
+                img if img.ndim == 3 else cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+                for img in preprocessed.values()
+            ])
+            output_path = output_dir / f"bar_{quarter}_all.png"
+            cv2.imwrite(str(output_path), montage, [cv2.IMWRITE_PNG_COMPRESSION, 1])
         
         print(f"{result['quarter']} processing completed")
     
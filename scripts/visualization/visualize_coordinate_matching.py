@@ -3,20 +3,21 @@
 import cv2
 import numpy as np
 from pathlib import Path
-from src.factset_report_analyzer.core.ocr.google_vision_processor import extract_text_with_boxes
+from src.factset_report_analyzer.core.ocr.google_vision_processor import cached_extract_text_with_boxes
 from src.factset_report_analyzer.core.ocr.coordinate_matcher import match_quarters_with_numbers
 
 
 def visualize_matching_results(image_path: Path, output_path: Path):
     """Visualize coordinate-based matching results."""
-    # Read image
-    image = cv2.imread(str(image_path))
+    # Read image once: the bytes go to Vision, the decoded array to OpenCV
+    raw = image_path.read_bytes() if image_path.exists() else b''
+    image = cv2.imdecode(np.frombuffer(raw, np.uint8), cv2.IMREAD_COLOR) if raw else None
     if image is None:
         print(f"Cannot read image: {image_path}")
         return
     
     # Get OCR results
-    ocr_results = extract_text_with_boxes(image_path)
+    ocr_results = cached_extract_text_with_boxes(image_path, content=raw)
     
     # Perform coordinate-based matching
     matched_results = match_quarters_with_numbers(ocr_results)
@@ -16,6 +16,10 @@ except ImportError:
 # Load environment variables from .env file
 load_dotenv()
 
+# Upload encoding: JPEG q85 is visually lossless for OCR and much smaller than the q95 default
+JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 85, cv2.IMWRITE_JPEG_OPTIMIZE, 1]
+MAX_SIDE = 4000  # Downscale larger images before upload (boxes are scaled back)
+
 
 def visualize_google_ocr_full(image_path: Path, output_path: Path):
     """Perform full image OCR using Google Cloud Vision API and display text."""
@@ -58,8 +62,11 @@ def visualize_google_ocr_full(image_path: Path, output_path: Path):
     print("\n=== Processing full image OCR with Google Cloud Vision ===")
     
     try:
-        # Convert image to bytes
-        _, buffer = cv2.imencode('.jpg', image)
+        # Convert image to bytes (downscaled if very large)
+        scale = min(1.0, MAX_SIDE / max(image.shape[:2]))
+        upload_image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA) \
+            if scale < 1.0 else image
+        _, buffer = cv2.imencode('.jpg', upload_image, JPEG_PARAMS)
         image_bytes = buffer.tobytes()
         
         # Call Google Vision API (full image)
@@ -83,10 +90,10 @@ def visualize_google_ocr_full(image_path: Path, output_path: Path):
             for i, annotation in enumerate(response.text_annotations[1:], 1):
                 vertices = annotation.bounding_poly.vertices
                 
-                # Extract bounding box coordinates
+                # Extract bounding box coordinates (in original image pixels)
                 points = []
                 for vertex in vertices:
-                    points.append([vertex.x, vertex.y])
+                    points.append([round(vertex.x / scale), round(vertex.y / scale)])
                 
                 if len(points) >= 3:
                     text = annotation.description
@@ -1,8 +1,9 @@
 """Analysis functionality for EPS data."""
 
-from .sp500 import SP500
+from .sp500 import SP500, get_sp500
 
 __all__ = [
     'SP500',
+    'get_sp500',
 ]
 
@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+import functools
+import re
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Literal
 
-# Type definitions
-PE_RATIO_TYPE = Literal['forward', 'trailing']
-import tempfile
-
+import numpy as np
 import pandas as pd
 
 from ..utils.csv_storage import read_csv
 
+# Type definitions
+PE_RATIO_TYPE = Literal['forward', 'trailing']
+QUARTER_COL_PATTERN = re.compile(r"^Q[1-4]'\d{2}$")
+
 
 class SP500:
     """S&P 500 Market Data with EPS and P/E ratio calculations.
@@ -39,7 +43,9 @@ class SP500:
     def __init__(self):
         """Initialize and load S&P 500 and EPS data."""
         self._df_eps = None
+        self._eps_matrix = None
         self._price_df = None
+        self._pe_cache: dict[str, pd.DataFrame] = {}
         self._type: PE_RATIO_TYPE = 'forward'  # Default to forward
         self._load_data()
     
@@ -73,12 +79,21 @@ class SP500:
         
         self._df_eps['Report_Date'] = pd.to_datetime(self._df_eps['Report_Date'])
         self._df_eps = self._df_eps.sort_values('Report_Date')
+        # Clean and forward-fill the quarter columns once for every EPS lookup
+        self._eps_matrix = _build_eps_matrix(self._df_eps)
         print(f"  ✅ EPS data: {len(self._df_eps)} reports")
         
         # Load S&P 500 price data
         min_date = self._df_eps['Report_Date'].min().strftime('%Y-%m-%d')
         end_date = datetime.now().strftime('%Y-%m-%d')
         
+        # Price history is cached on disk per (start, end) so repeat runs on the same day skip the network
+        price_cache = Path(tempfile.gettempdir()) / f"sp500_prices_{min_date}_{end_date}.csv"
+        if price_cache.exists():
+            self._price_df = pd.read_csv(price_cache, parse_dates=['Date'])
+            print(f"  ✅ Price data: {len(self._price_df)} trading days (cached)")
+            return
+        
         try:
             import yfinance as yf
             ticker = yf.Ticker('^GSPC')
@@ -96,6 +111,15 @@ class SP500:
             )
         except Exception as e:
             raise Exception(f"Failed to load S&P 500 price data: {e}")
+        
+        # Don't pin an empty history (e.g. rate-limited response) for the rest of the day
+        if not self._price_df.empty:
+            try:
+                for stale in price_cache.parent.glob('sp500_prices_*.csv'):
+                    stale.unlink(missing_ok=True)
+                self._price_df.to_csv(price_cache, index=False)
+            except OSError:
+                pass
     
     @property
     def price(self) -> pd.DataFrame:
@@ -109,7 +133,8 @@ class SP500:
             >>> prices = sp500.price
             >>> print(prices.head())
         """
-        return self._price_df[['Date', 'Price']].copy()
+        # Column selection already returns a new frame
+        return self._price_df[['Date', 'Price']]
     
     @property
     def eps(self) -> pd.DataFrame:
@@ -125,7 +150,7 @@ class SP500:
             >>> eps_data = sp500.eps  # trailing
         """
         dates = self._price_df['Date']
-        eps_values = calculate_eps_sum(self._df_eps, dates, self._type)
+        eps_values = _eps_sum_from_matrix(self._eps_matrix, dates, self._type)
         return pd.DataFrame({
             'Date': dates,
             'EPS': eps_values
@@ -136,7 +161,8 @@ class SP500:
         """Get all P/E ratio data based on current type setting.
         
         Returns:
-            DataFrame with Date, Price, EPS, PE_Ratio, Type
+            DataFrame with Date, Price, EPS, PE_Ratio, Type (cached per type;
+            call .copy() before modifying values in place)
             
         Example:
             >>> sp500 = SP500()
@@ -144,12 +170,23 @@ class SP500:
             >>> sp500.set_type('trailing')
             >>> pe_df = sp500.pe_ratio  # trailing
         """
+        if self._type not in self._pe_cache:
+            self._pe_cache[self._type] = self._build_pe_ratio()
+        # Shallow copy shares the cached buffers: copy() before editing values in place
+        return self._pe_cache[self._type].copy(deep=False)
+    
+    def _build_pe_ratio(self) -> pd.DataFrame:
+        """Build the P/E ratio DataFrame for the current type."""
         dates = self._price_df['Date']
-        price_data = self._price_df.copy()
-        price_data['EPS'] = calculate_eps_sum(self._df_eps, dates, self._type)
-        price_data['PE_Ratio'] = price_data['Price'] / price_data['EPS']
-        price_data['Type'] = self._type
-        return price_data[['Date', 'Price', 'EPS', 'PE_Ratio', 'Type']].reset_index(drop=True)
+        eps = _eps_sum_from_matrix(self._eps_matrix, dates, self._type)
+        price_data = pd.DataFrame({
+            'Date': dates,
+            'Price': self._price_df['Price'],
+            'EPS': eps,
+            'PE_Ratio': self._price_df['Price'] / eps,
+            'Type': self._type
+        })
+        return price_data.reset_index(drop=True)
     
     @property
     def current_pe(self) -> dict:
@@ -164,12 +201,12 @@ class SP500:
             >>> print(f"Forward P/E: {current['pe_ratio']:.2f}")
         """
         pe_df = self.pe_ratio
-        # Find last row with valid EPS
-        valid_df = pe_df.dropna(subset=['EPS'])
-        if valid_df.empty:
+        # Find last row with valid EPS (no filtered copy of the frame)
+        last = pe_df['EPS'].last_valid_index()
+        if last is None:
             return None
         
-        latest = valid_df.iloc[-1]
+        latest = pe_df.loc[last]
         return {
             'date': latest['Date'],
             'price': latest['Price'],
@@ -191,6 +228,15 @@ class SP500:
         }
     
 
+@functools.lru_cache(maxsize=1)
+def get_sp500() -> SP500:
+    """Get a shared SP500 instance (data is loaded once per process).
+    
+    Note that set_type() on the returned instance affects every caller.
+    """
+    return SP500()
+
+
 def quarter_mapper(report_date: pd.Timestamp, start: int, end: int = 0) -> list[str]:
     """Map relative quarter positions to quarter column names.
     
@@ -224,6 +270,10 @@ def calculate_eps_sum(
 ) -> pd.Series:
     """Calculate 4-quarter EPS sum for given dates.
     
+    For each date, uses the most recent value of each needed quarter column
+    among reports published on or before that date. Returns NaN when a quarter
+    is missing or the sum is not positive.
+    
     Args:
         df_eps: DataFrame with EPS data (must have 'Report_Date' column)
         dates: Series of dates to calculate EPS for
@@ -236,44 +286,65 @@ def calculate_eps_sum(
         >>> eps_series = calculate_eps_sum(df_eps, df['Report_Date'], 'forward')
     """
     df_eps_sorted = df_eps.sort_values('Report_Date')
-    
-    results = [
-        _calculate_eps_for_date(df_eps_sorted, date, type)
-        for date in dates
-    ]
-    return pd.Series(results, index=dates.index)
+    return _eps_sum_from_matrix(_build_eps_matrix(df_eps_sorted), dates, type)
 
 
-def _calculate_eps_for_date(
-    df_eps_sorted: pd.DataFrame,
-    price_date: pd.Timestamp,
+def _eps_sum_from_matrix(
+    matrix: tuple[np.ndarray, np.ndarray, dict[str, int]],
+    dates: pd.Series,
     type: PE_RATIO_TYPE
-) -> float | None:
-    """Calculate 4-quarter EPS sum for a single date."""
-    # Get quarter column names using price_date
-    if type == 'forward':
-        needed_quarters = quarter_mapper(price_date, 0, 3)
-    else:  # trailing
-        needed_quarters = quarter_mapper(price_date, -4, -1)
+) -> pd.Series:
+    """Calculate 4-quarter EPS sums from a matrix built by _build_eps_matrix."""
+    report_dates, eps_matrix, col_pos = matrix
     
-    # Filter to only needed quarter columns
-    eps_candidates = df_eps_sorted[df_eps_sorted['Report_Date'] <= price_date]
-    if eps_candidates.empty:
-        return None
+    date_index = pd.DatetimeIndex(dates)
+    offsets = np.arange(0, 4) if type == 'forward' else np.arange(-4, 0)
+    if len(date_index) == 0:
+        return pd.Series(np.nan, index=dates.index)
     
-    eps_filtered = eps_candidates[needed_quarters]
+    # Latest report on or before each date (-1 if none)
+    rows = np.searchsorted(report_dates, date_index.values, side='right') - 1
+    # Absolute quarter number of each needed quarter, as in quarter_mapper: shape (dates, 4)
+    base = date_index.year.to_numpy() * 4 + date_index.quarter.to_numpy() - 1
+    quarter_abs = base[:, None] + offsets
     
-    # Get most recent value for each quarter column
-    values = [
-        float(str(eps_filtered[col].dropna().iloc[-1]).replace('*', '').strip())
-        for col in needed_quarters
-        if col in eps_filtered.columns and not eps_filtered[col].dropna().empty
-    ]
+    # Matrix column of every quarter number in range (-1 if the CSV has no such column)
+    lo, hi = quarter_abs.min(), quarter_abs.max()
+    col_table = np.array([col_pos.get(f"Q{q % 4 + 1}'{(q // 4) % 100:02d}", -1) for q in range(lo, hi + 1)], dtype=int)
+    cols = col_table[quarter_abs - lo]
+    
+    # Gather all four quarters for every date in one fancy-indexing pass
+    valid = (rows[:, None] >= 0) & (cols >= 0)
+    values = np.where(valid, eps_matrix[np.maximum(rows, 0)[:, None], np.maximum(cols, 0)], np.nan) \
+        if eps_matrix.size else np.full(quarter_abs.shape, np.nan)
+    
+    total = values.sum(axis=1)
+    total[~(total > 0)] = np.nan
+    return pd.Series(total, index=dates.index)
+
+
+def _build_eps_matrix(df_eps_sorted: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, dict[str, int]]:
+    """Build a forward-filled EPS matrix from reports sorted by Report_Date.
+    
+    Returns:
+        Tuple of (report dates as datetime64 array, float matrix where row i holds
+        the latest known value of each quarter column as of report i, mapping of
+        quarter column name to matrix column)
+    """
+    quarter_cols = [col for col in df_eps_sorted.columns if QUARTER_COL_PATTERN.match(str(col))]
     
-    if len(values) == 4:
-        return sum(values) if sum(values) > 0 else None
+    # Carry the latest non-null raw value forward, then strip '*' and parse.
+    # Only text columns (those holding '*'-marked values) need the string pass.
+    latest = df_eps_sorted[quarter_cols].ffill()
+    text_cols = [col for col in quarter_cols if not pd.api.types.is_numeric_dtype(latest[col])]
+    if len(text_cols):
+        latest[text_cols] = latest[text_cols].apply(
+            lambda s: pd.to_numeric(s.astype(str).str.replace('*', '', regex=False).str.strip(), errors='coerce')
+        )
+    eps_matrix = latest.to_numpy(dtype=float)
     
-    return None
+    report_dates = pd.to_datetime(df_eps_sorted['Report_Date']).to_numpy()
+    return report_dates, eps_matrix, {col: i for i, col in enumerate(quarter_cols)}
 
 
 if __name__ == "__main__":
@@ -2,21 +2,146 @@
 
 from __future__ import annotations
 
+import threading
 import time
-import urllib.error
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import urllib3
+
 # Base URL for FactSet PDFs
 BASE_URL = "https://advantage.factset.com/hubfs/Website/Resources%20Section/Research%20Desk/Earnings%20Insight/"
 
+# Write buffer / stream chunk size when saving PDFs to disk (128 KiB)
+_WRITE_CHUNK_SIZE = 128 * 1024
+
+# Concurrent URL probes (each probe is a latency-bound HTTP round trip)
+MAX_WORKERS = 16
+
+# Shared keep-alive pool: probes reuse TCP/TLS connections to the FactSet host
+_HTTP = urllib3.PoolManager(
+    maxsize=2 * MAX_WORKERS,
+    headers={'User-Agent': 'Mozilla/5.0'},
+    retries=urllib3.Retry(total=2, backoff_factor=0.2)
+)
+
+
+class _RateLimiter:
+    """Space request starts at least `interval` seconds apart across threads."""
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = time.monotonic()
+    
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def _url(fmt: str) -> str:
+    """Download URL for a date-format string (e.g., '121324')."""
+    return f"{BASE_URL}EarningsInsight_{fmt}.pdf"
+
+
+def _filename(date: datetime, fmt: str) -> str:
+    """Saved filename: EarningsInsight_YYYYMMDD_<fmt>.pdf."""
+    return f"EarningsInsight_{date.strftime('%Y%m%d')}_{fmt}.pdf"
+
+
+def _build_tasks(dates: list[datetime], skip_existing: set[str] | None) -> list[tuple[datetime, str]]:
+    """Flatten dates into (date, format) probe tasks, newest first, short format first."""
+    tasks = []
+    for date in dates:
+        # Date format conversion
+        for fmt in (date.strftime("%m%d%y"), date.strftime("%m%d%Y")):  # 121324, 12132024
+            # Skip if already exists in cloud (checked before requesting, so the PDF is never fetched)
+            if skip_existing and _filename(date, fmt) in skip_existing:
+                continue
+            tasks.append((date, fmt))
+    return tasks
+
+
+def _probe(task: tuple[datetime, str], limiter: _RateLimiter) -> bool:
+    """Check whether the PDF for a (date, format) task exists (HEAD, no body transfer)."""
+    limiter.wait()
+    try:
+        return _HTTP.request('HEAD', _url(task[1]), timeout=3.0).status == 200
+    except Exception:
+        return False  # Connection errors after retries
+
+
+def _fetch_first(
+    date: datetime,
+    fmts: list[str],
+    limiter: _RateLimiter,
+    outpath: Path | None = None
+) -> dict | None:
+    """Download the first available format for a date.
+    
+    The PDF is kept in memory ('content'), or streamed straight to outpath ('path')
+    without buffering the whole body when outpath is given.
+    """
+    for fmt in fmts:
+        url = _url(fmt)
+        filename = _filename(date, fmt)
+        limiter.wait()
+        try:
+            response = _HTTP.request('GET', url, timeout=5.0, preload_content=outpath is None)
+        except Exception:
+            continue
+        
+        if response.status != 200:
+            if outpath is not None:
+                response.release_conn()
+            continue
+        
+        pdf_info = {
+            'date': date.strftime("%Y-%m-%d"),
+            'format': fmt,
+            'url': url,
+            'filename': filename,
+        }
+        
+        if outpath is None:
+            pdf_info['content'] = response.data
+            pdf_info['size_kb'] = len(response.data) / 1024
+            return pdf_info
+        
+        # Stream to a temp file, then rename so partial downloads never look complete
+        save_path = outpath / filename
+        tmp_path = save_path.with_suffix('.pdf.part')
+        try:
+            size = 0
+            with open(tmp_path, 'wb', buffering=_WRITE_CHUNK_SIZE) as f:
+                for chunk in response.stream(_WRITE_CHUNK_SIZE):
+                    f.write(chunk)
+                    size += len(chunk)
+            tmp_path.replace(save_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            continue
+        finally:
+            response.release_conn()
+        
+        pdf_info['path'] = save_path
+        pdf_info['size_kb'] = size / 1024
+        return pdf_info
+    return None
+
 
 def download_pdfs(
     start_date: datetime | None = None,
     end_date: datetime | None = None,
     rate_limit: float = 0.05,
-    skip_existing: set[str] | None = None
+    skip_existing: set[str] | None = None,
+    max_workers: int = MAX_WORKERS,
+    outpath: Path | None = None
 ) -> list[dict]:
     """Download FactSet Earnings Insight PDFs.
     
@@ -25,8 +150,10 @@ def download_pdfs(
     Args:
         start_date: Start date for download (default: 2016-01-01)
         end_date: End date for download (default: today)
-        rate_limit: Wait time between requests in seconds (default: 0.05)
+        rate_limit: Minimum spacing between request starts in seconds (default: 0.05)
         skip_existing: Set of existing filenames to skip
+        max_workers: Number of concurrent HTTP requests (default: 16)
+        outpath: Directory to stream PDFs into (None to keep them in memory)
         
     Returns:
         List of dictionaries containing download information:
@@ -35,7 +162,8 @@ def download_pdfs(
         - 'url': Download URL
         - 'size_kb': File size in KB
         - 'filename': Filename (without path)
-        - 'content': PDF file content (bytes)
+        - 'content': PDF file content (bytes; only when outpath is None)
+        - 'path': Saved file path (only when outpath is given)
         
     Note:
         PDFs are available from 2016 onwards. If start_date is before 2016,
@@ -54,66 +182,39 @@ def download_pdfs(
         start_date = min_date
     
     found_pdfs: list[dict] = []
-    current = end_date
-    test_count = 0
+    if outpath is not None:
+        outpath.mkdir(parents=True, exist_ok=True)
+    
+    # Newest first; the last date probed is start_date
+    total_days = (end_date - start_date).days
+    dates = [end_date - timedelta(days=i) for i in range(total_days + 1)]
+    tasks = _build_tasks(dates, skip_existing)
+    limiter = _RateLimiter(rate_limit)
     
     print("🔍 FactSet Earnings Insight PDF reverse search and download")
     print(f"Period: {end_date.date()} → {start_date.date()} (reverse)")
     print("=" * 80)
     
-    while current >= start_date:
-        # Date format conversion
-        formats = [
-            current.strftime("%m%d%y"),      # 121324
-            current.strftime("%m%d%Y"),      # 12132024
-        ]
-        
-        for fmt in formats:
-            url = f"{BASE_URL}EarningsInsight_{fmt}.pdf"
-            test_count += 1
-            
-            try:
-                # Download with urllib
-                req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-                with urllib.request.urlopen(req, timeout=5) as response:
-                    if response.status == 200:
-                        content = response.read()
-                        size_kb = len(content) / 1024
-                        
-                        # Filename
-                        filename = f"EarningsInsight_{current.strftime('%Y%m%d')}_{fmt}.pdf"
-                        
-                        # Skip if already exists in cloud
-                        if skip_existing and filename in skip_existing:
-                            continue
-                        
-                        found_pdfs.append({
-                            'date': current.strftime("%Y-%m-%d"),
-                            'format': fmt,
-                            'url': url,
-                            'size_kb': size_kb,
-                            'filename': filename,
-                            'content': content
-                        })
-                        
-                        print(f"✅ {current.strftime('%Y-%m-%d')}: {fmt:12s} | {size_kb:6.1f} KB | Download complete")
-                        break  # Move to next date if found
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        # Probe every (date, format) URL concurrently; map() yields in task order
+        hits: dict[datetime, list[str]] = {}
+        for test_count, ((date, fmt), exists) in enumerate(
+            zip(tasks, executor.map(lambda t: _probe(t, limiter), tasks)), 1
+        ):
+            if exists:
+                hits.setdefault(date, []).append(fmt)
             
-            except urllib.error.HTTPError:
-                pass  # 404, etc.
-            except Exception:
-                pass
+            # Progress every 200 files
+            if test_count % 200 == 0:
+                elapsed_days = (end_date - date).days
+                progress = elapsed_days / total_days * 100 if total_days > 0 else 0
+                print(f"⏳ Progress: {progress:.1f}% | Tested: {test_count:,} | Found: {len(hits)}")
         
-        # Progress every 200 files
-        if test_count % 200 == 0:
-            elapsed_days = (end_date - current).days
-            total_days = (end_date - start_date).days
-            progress = elapsed_days / total_days * 100 if total_days > 0 else 0
-            print(f"⏳ Progress: {progress:.1f}% | Tested: {test_count:,} | Found: {len(found_pdfs)}")
-        
-        current -= timedelta(days=1)  # Go back one day
-        time.sleep(rate_limit)
+        # Download one PDF per date that has a hit (dict keeps newest-first order)
+        for pdf_info in executor.map(lambda item: _fetch_first(*item, limiter, outpath), hits.items()):
+            if pdf_info:
+                found_pdfs.append(pdf_info)
+                print(f"✅ {pdf_info['date']}: {pdf_info['format']:12s} | {pdf_info['size_kb']:6.1f} KB | Download complete")
     
     print(f"\n📊 Final Results: {len(found_pdfs)} PDFs downloaded")
     return found_pdfs
-
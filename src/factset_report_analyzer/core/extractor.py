@@ -2,11 +2,25 @@
 
 from __future__ import annotations
 
+import io
+import multiprocessing
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+import cv2
+import numpy as np
 import pdfplumber
 
+try:
+    import pymupdf  # type: ignore[import-untyped]  # Optional: native (much faster) text layer and renderer
+except ImportError:
+    pymupdf = None  # type: ignore[assignment]
+
+# Fast zlib level for rendered PNGs: encode time matters more than a somewhat larger file
+PNG_COMPRESS_LEVEL = 1
+
 # Keywords to identify EPS chart pages
 KEYWORDS = [
     "Bottom-Up EPS Estimates: Current & Historical",
@@ -15,16 +29,122 @@ KEYWORDS = [
 ]
 
 
+def _target_page_num(page_num: int, words: list[tuple[str, float]], num_pages: int) -> int | None:
+    """Return the chart page index if this page has an EPS chart keyword, else None.
+    
+    Args:
+        page_num: Index of the page the words come from
+        words: (text, top) for each word on the page
+        num_pages: Total number of pages in the PDF
+    """
+    text = " ".join(w for w, _ in words)
+    if not any(kw in text for kw in KEYWORDS):
+        return None
+    
+    # If keyword is at bottom of page, the chart is on the next page
+    keyword_at_bottom = any(
+        top > 700 and any(kw.split()[0] in w for kw in KEYWORDS)
+        for w, top in words
+    )
+    if keyword_at_bottom and page_num + 1 < num_pages:
+        return page_num + 1
+    return page_num
+
+
+def _render_chart_pymupdf(pdf_path: Path) -> tuple[int, bytes] | None:
+    """Find and render the chart page with PyMuPDF. Returns (page index, PNG bytes)."""
+    with pymupdf.open(pdf_path) as doc:
+        for page_num, page in enumerate(doc):
+            # Word tuples: (x0, y0, x1, y1, text, block, line, word)
+            words = [(w[4], w[1]) for w in page.get_text("words")]
+            target = _target_page_num(page_num, words, doc.page_count)
+            if target is not None:
+                pix = doc[target].get_pixmap(dpi=300, alpha=False)
+                rgb = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
+                _, png = cv2.imencode('.png', cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR),
+                                      [cv2.IMWRITE_PNG_COMPRESSION, PNG_COMPRESS_LEVEL])
+                return target, png.tobytes()
+    return None
+
+
+def _render_chart_pdfplumber(pdf_path: Path) -> tuple[int, bytes] | None:
+    """Find and render the chart page with pdfplumber. Returns (page index, PNG bytes)."""
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Extract words once; text for the keyword match is derived from them
+            words = [(w['text'], w['top']) for w in page.extract_words()]
+            target = _target_page_num(page_num, words, len(pdf.pages))
+            if target is not None:
+                # Get image bytes (save to BytesIO instead of disk)
+                img = pdf.pages[target].to_image(resolution=300)
+                img_bytes = io.BytesIO()
+                img.save(img_bytes, format='PNG', compress_level=PNG_COMPRESS_LEVEL)
+                return target, img_bytes.getvalue()
+    return None
+
+
+def _extract_one(pdf_path: Path | str) -> tuple[tuple[str, bytes] | None, str]:
+    """Extract the EPS chart page from a single PDF.
+    
+    Args:
+        pdf_path: PDF file path
+        
+    Returns:
+        Tuple of ((filename, image_bytes) or None, status message)
+    """
+    if isinstance(pdf_path, str):
+        pdf_path = Path(pdf_path)
+    
+    if not pdf_path.exists():
+        return None, f"⚠️  Skipping {pdf_path.name}: File not found"
+    
+    # Extract date from filename (EarningsInsight_20161209_120916.pdf -> 20161209)
+    try:
+        date_str = pdf_path.stem.split('_')[1]
+        report_date_dt = datetime.strptime(date_str, '%Y%m%d')
+        report_date = report_date_dt.strftime('%Y-%m-%d')
+    except (IndexError, ValueError):
+        return None, f"⚠️  Skipping {pdf_path.name}: Cannot extract date from filename"
+    
+    filename = f"{date_str}.png"
+    
+    try:
+        render = _render_chart_pymupdf if pymupdf else _render_chart_pdfplumber
+        found = render(pdf_path)
+    except Exception as e:
+        return None, f"❌ {report_date}: Error - {str(e)[:50]}"
+    
+    if found is None:
+        return None, f"⚠️  {report_date}: No EPS chart page found"
+    
+    target_page_num, image_bytes = found
+    return (filename, image_bytes), f"✅ {report_date:12s} Page {target_page_num + 1:2d} -> {filename}"
+
+
+def _iter_results(pdfs: list[Path | str], workers: int) -> Iterator[tuple[tuple[str, bytes] | None, str]]:
+    """Yield _extract_one results in input order, using a process pool when workers > 1."""
+    if workers <= 1:
+        yield from map(_extract_one, pdfs)
+        return
+    
+    # pdfplumber parsing is CPU-bound pure Python, so use processes instead of threads
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+        yield from executor.map(_extract_one, pdfs, chunksize=4)
+
+
 def extract_charts(
-    pdfs: list[Path | str]
+    pdfs: list[Path | str],
+    workers: int = 1
 ) -> list[tuple[str, bytes]]:
     """Extract EPS estimate chart pages from PDF files.
     
     Extracts the page containing "Bottom-Up EPS Estimates" chart from each PDF
-    and returns PNG image data in memory.
+    and returns PNG image data in memory. Uses PyMuPDF when installed
+    (much faster text extraction and rendering), otherwise pdfplumber.
     
     Args:
         pdfs: List of PDF file paths (Path objects or strings)
+        workers: Number of worker processes for PDF parsing (1 to process serially)
         
     Returns:
         List of tuples (filename, image_bytes) for extracted PNG files
@@ -34,63 +154,10 @@ def extract_charts(
     print(f"🔍 Extracting EPS charts from {len(pdfs)} PDFs")
     print("=" * 80)
     
-    for pdf_path in pdfs:
-        if isinstance(pdf_path, str):
-            pdf_path = Path(pdf_path)
-        
-        if not pdf_path.exists():
-            print(f"⚠️  Skipping {pdf_path.name}: File not found")
-            continue
-        
-        # Extract date from filename (EarningsInsight_20161209_120916.pdf -> 20161209)
-        try:
-            date_str = pdf_path.stem.split('_')[1]
-            report_date_dt = datetime.strptime(date_str, '%Y%m%d')
-            report_date = report_date_dt.strftime('%Y-%m-%d')
-        except (IndexError, ValueError):
-            print(f"⚠️  Skipping {pdf_path.name}: Cannot extract date from filename")
-            continue
-        
-        filename = f"{date_str}.png"
-        
-        try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    text = page.extract_text()
-                    
-                    if text and any(kw in text for kw in KEYWORDS):
-                        # Check keyword location (if at bottom of page)
-                        keyword_at_bottom = False
-                        for word in page.extract_words():
-                            if any(kw.split()[0] in word['text'] for kw in KEYWORDS):
-                                if word['top'] > 700:
-                                    keyword_at_bottom = True
-                                    break
-                        
-                        # If keyword is at bottom, extract next page
-                        if keyword_at_bottom and page_num + 1 < len(pdf.pages):
-                            target_page = pdf.pages[page_num + 1]
-                            target_page_num = page_num + 2
-                        else:
-                            target_page = page
-                            target_page_num = page_num + 1
-                        
-                        # Get image bytes (save to BytesIO instead of disk)
-                        import io
-                        img = target_page.to_image(resolution=300)
-                        img_bytes = io.BytesIO()
-                        img.save(img_bytes, format='PNG')
-                        image_bytes = img_bytes.getvalue()
-                        
-                        print(f"✅ {report_date:12s} Page {target_page_num:2d} -> {filename}")
-                        extracted_files.append((filename, image_bytes))
-                        break
-                else:
-                    print(f"⚠️  {report_date}: No EPS chart page found")
-        
-        except Exception as e:
-            print(f"❌ {report_date}: Error - {str(e)[:50]}")
+    for chart, message in _iter_results(pdfs, workers):
+        print(message)
+        if chart:
+            extracted_files.append(chart)
     
     print(f"\n📊 Result: {len(extracted_files)} PNG files extracted")
     return extracted_files
-
@@ -1,7 +1,10 @@
 """OCR processing for chart images."""
 
 from .processor import process_directory as process_images, process_image
-from .google_vision_processor import extract_text_from_image, extract_text_with_boxes
+from .google_vision_processor import (
+    extract_text_from_image, extract_text_with_boxes, extract_text_with_boxes_batch,
+    extract_text_with_boxes_from_bytes, cached_extract_text_with_boxes,
+)
 from .parser import parse_quarter, parse_number, get_report_date_from_filename
 
 __all__ = [
@@ -9,6 +12,9 @@ __all__ = [
     'process_image',
     'extract_text_from_image',
     'extract_text_with_boxes',
+    'extract_text_with_boxes_batch',
+    'extract_text_with_boxes_from_bytes',
+    'cached_extract_text_with_boxes',
     'parse_quarter',
     'parse_number',
     'get_report_date_from_filename',
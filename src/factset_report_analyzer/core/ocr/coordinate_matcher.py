@@ -3,6 +3,18 @@
 import re
 import math
 
+import numpy as np
+
+# Compiled once at import: these run for every OCR box
+_Q_OCR_PREFIX_RE = re.compile(r'^[O0](?=[1-4])', re.IGNORECASE)
+_Q_OCR_ONE_RE = re.compile(r'Q([Il])(?=\d)', re.IGNORECASE)
+_QUARTER_APOSTROPHE_RE = re.compile(r"Q([1-4])'(\d{2})", re.IGNORECASE)
+_QUARTER_FULL_YEAR_RE = re.compile(r"Q([1-4])\s+20(\d{2})", re.IGNORECASE)
+_QUARTER_JOINED_RE = re.compile(r"Q([1-4])(\d{2})", re.IGNORECASE)
+_QUARTER_ZERO_RE = re.compile(r"[0Oo]([1-4])(\d{2})")
+_QUARTER_GARBLED_RE = re.compile(r"Q([1-4])[iIl1](\d)[yi]", re.IGNORECASE)
+_NUMBER_RE = re.compile(r'-?\d+\.?\d*')
+
 
 def normalize_quarter_text(text: str) -> str:
     """Normalize Q pattern text.
@@ -18,10 +30,10 @@ def normalize_quarter_text(text: str) -> str:
         Normalized text
     """
     # Convert O or 0 recognized as Q to Q
-    text = re.sub(r'^[O0](?=[1-4])', 'Q', text, flags=re.IGNORECASE)
+    text = _Q_OCR_PREFIX_RE.sub('Q', text)
     
     # Convert I or l recognized as 1 to 1 (only when following Q)
-    text = re.sub(r'Q([Il])(?=\d)', r'Q1', text, flags=re.IGNORECASE)
+    text = _Q_OCR_ONE_RE.sub('Q1', text)
     
     return text
 
@@ -39,24 +51,21 @@ def extract_quarter_pattern(text: str) -> str | None:
     normalized = normalize_quarter_text(text)
     
     # Pattern: Q1'17, Q2'18, etc.
-    pattern = r"Q([1-4])'(\d{2})"
-    match = re.search(pattern, normalized, re.IGNORECASE)
+    match = _QUARTER_APOSTROPHE_RE.search(normalized)
     if match:
         quarter = match.group(1)
         year = match.group(2)
         return f"Q{quarter}'{year}"
     
     # Pattern: Q1 2017, Q2 2018, etc.
-    pattern = r"Q([1-4])\s+20(\d{2})"
-    match = re.search(pattern, normalized, re.IGNORECASE)
+    match = _QUARTER_FULL_YEAR_RE.search(normalized)
     if match:
         quarter = match.group(1)
         year = match.group(2)
         return f"Q{quarter}'{year}"
     
     # Pattern: Q114, Q214, etc. (when OCR recognizes Q1'14 as Q114)
-    pattern = r"Q([1-4])(\d{2})"
-    match = re.search(pattern, normalized, re.IGNORECASE)
+    match = _QUARTER_JOINED_RE.search(normalized)
     if match:
         quarter = match.group(1)
         year = match.group(2)
@@ -65,8 +74,7 @@ def extract_quarter_pattern(text: str) -> str | None:
             return f"Q{quarter}'{year}"
     
     # Pattern: 0114, 0214, etc. (when OCR recognizes Q1'14 as 0114)
-    pattern = r"[0Oo]([1-4])(\d{2})"
-    match = re.search(pattern, normalized)
+    match = _QUARTER_ZERO_RE.search(normalized)
     if match:
         quarter = match.group(1)
         year = match.group(2)
@@ -75,8 +83,7 @@ def extract_quarter_pattern(text: str) -> str | None:
             return f"Q{quarter}'{year}"
     
     # Pattern: Q1i7y, Q2i7y, etc. (when OCR misrecognizes Q1'17)
-    pattern = r"Q([1-4])[iIl1](\d)[yi]"
-    match = re.search(pattern, normalized, re.IGNORECASE)
+    match = _QUARTER_GARBLED_RE.search(normalized)
     if match:
         quarter = match.group(1)
         year_digit = match.group(2)
@@ -103,8 +110,7 @@ def extract_number(text: str) -> float | None:
     cleaned = text.replace(',', '').replace('-', '')
     
     # Pattern for numbers with decimal points
-    pattern = r'-?\d+\.?\d*'
-    match = re.search(pattern, cleaned)
+    match = _NUMBER_RE.search(cleaned)
     
     if match:
         try:
@@ -189,9 +195,45 @@ def find_quarters_at_bottom(ocr_results: list[dict], bottom_percent: float = 0.3
     return quarter_boxes
 
 
+def _number_candidates(ocr_results: list[dict]) -> dict:
+    """Parse every OCR box once into arrays of number candidates.
+    
+    Boxes containing a Q pattern or no number are dropped, so the per-quarter
+    search only does vector comparisons.
+    
+    Args:
+        ocr_results: OCR result list
+        
+    Returns:
+        Dictionary of parallel arrays: index (into ocr_results), number, left, top,
+        width, height, center_x, center_y
+    """
+    index, numbers = [], []
+    for i, box in enumerate(ocr_results):
+        # Exclude text containing Q pattern
+        if extract_quarter_pattern(box['text']) is not None:
+            continue
+        number = extract_number(box['text'])
+        if number is not None:
+            index.append(i)
+            numbers.append(number)
+    
+    boxes = [ocr_results[i] for i in index]
+    candidates = {
+        'index': np.array(index, dtype=np.intp),
+        'number': np.array(numbers, dtype=np.float64),
+    }
+    for key in ('left', 'top', 'width', 'height'):
+        candidates[key] = np.array([b[key] for b in boxes], dtype=np.float64)
+    candidates['center_x'] = candidates['left'] + candidates['width'] / 2
+    candidates['center_y'] = candidates['top'] + candidates['height'] / 2
+    return candidates
+
+
 def find_nearest_number_in_y_range(quarter_box: dict, ocr_results: list[dict], 
                                    y_tolerance: float = 1000.0,
-                                   x_tolerance: float = 10.0) -> dict | None:
+                                   x_tolerance: float = 10.0,
+                                   candidates: dict | None = None) -> dict | None:
     """Find nearest number within same y range.
     
     Args:
@@ -199,73 +241,45 @@ def find_nearest_number_in_y_range(quarter_box: dict, ocr_results: list[dict],
         ocr_results: OCR result list
         y_tolerance: y coordinate tolerance (maximum distance to numbers above Q box)
         x_tolerance: x coordinate tolerance (only consider numbers at similar x position, very small)
+        candidates: Precomputed _number_candidates(ocr_results) (computed if None)
         
     Returns:
         Nearest number box or None
     """
-    candidate_numbers = []
+    c = candidates if candidates is not None else _number_candidates(ocr_results)
     
     # Center coordinates of Q box
     q_center_x = quarter_box['left'] + quarter_box['width'] / 2
     q_center_y = quarter_box['top'] + quarter_box['height'] / 2
     
-    for box in ocr_results:
+    y_diff = q_center_y - c['center_y']
+    x_diff = np.abs(c['center_x'] - q_center_x)
+    
+    mask = (
         # Exclude same box (compare by coordinates)
-        if (box['left'] == quarter_box['left'] and 
-            box['top'] == quarter_box['top'] and
-            box['width'] == quarter_box['width'] and
-            box['height'] == quarter_box['height']):
-            continue
-        
-        # Exclude text containing Q pattern
-        if extract_quarter_pattern(box['text']) is not None:
-            continue
-        
-        # Check if number
-        number = extract_number(box['text'])
-        if number is None:
-            continue
-        
-        # Center coordinates of box
-        box_center_x = box['left'] + box['width'] / 2
-        box_center_y = box['top'] + box['height'] / 2
-        
-        # Check if above Q box (y coordinate should be smaller)
-        if box_center_y >= q_center_y:
-            continue
-        
-        # Calculate y difference
-        y_diff = q_center_y - box_center_y
-        if y_diff > y_tolerance:  # Exclude if too far above
-            continue
-        
-        # Check if x coordinate is in similar range (very strict)
-        x_diff = abs(box_center_x - q_center_x)
-        if x_diff > x_tolerance:
-            continue
-        
+        ~((c['left'] == quarter_box['left']) & (c['top'] == quarter_box['top']) &
+          (c['width'] == quarter_box['width']) & (c['height'] == quarter_box['height']))
+        # Above Q box (y coordinate should be smaller) but not too far above
+        & (y_diff > 0) & (y_diff <= y_tolerance)
+        # x coordinate in similar range (very strict)
+        & (x_diff <= x_tolerance)
         # Exclude large numbers like years (>= 2000)
-        if number >= 2000:
-            continue
-        
-        # Calculate distance (weight x difference much more)
-        distance = math.sqrt(x_diff ** 2 * 10 + y_diff ** 2 * 0.1)  # 10x weight on x difference
-        
-        candidate_numbers.append({
-            **box,
-            'number': number,
-            'distance': distance,
-            'x_diff': x_diff,
-            'y_diff': y_diff
-        })
-    
-    if not candidate_numbers:
+        & (c['number'] < 2000)
+    )
+    if not mask.any():
         return None
     
-    # Sort by distance (closest first)
-    candidate_numbers.sort(key=lambda x: x['distance'])
-    
-    return candidate_numbers[0]
+    # Distance with 10x weight on x difference; argmin keeps the first of equal distances
+    distance = np.sqrt(x_diff ** 2 * 10 + y_diff ** 2 * 0.1)
+    best = np.flatnonzero(mask)[np.argmin(distance[mask])]
+    
+    return {
+        **ocr_results[c['index'][best]],
+        'number': float(c['number'][best]),
+        'distance': float(distance[best]),
+        'x_diff': float(x_diff[best]),
+        'y_diff': float(y_diff[best])
+    }
 
 
 def match_quarters_with_numbers(ocr_results: list[dict], 
@@ -291,10 +305,13 @@ def match_quarters_with_numbers(ocr_results: list[dict],
     
     matched_results = []
     
+    # Parse number candidates once for all quarters
+    candidates = _number_candidates(ocr_results)
+    
     for quarter_box in quarter_boxes:
         # Find nearest number within same y range
         nearest_number_box = find_nearest_number_in_y_range(
-            quarter_box, ocr_results, y_tolerance, x_tolerance
+            quarter_box, ocr_results, y_tolerance, x_tolerance, candidates
         )
         
         if nearest_number_box:
@@ -1,6 +1,9 @@
 """Module for image OCR processing using Google Cloud Vision API."""
 
 from pathlib import Path
+import hashlib
+import json
+import logging
 import os
 import cv2
 import numpy as np
@@ -15,9 +18,27 @@ except ImportError:
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Maximum images per synchronous batch_annotate_images request (API limit)
+VISION_BATCH_SIZE = 16
+
+# Cap on summed image bytes per batch request, below the API's ~10 MB request size limit
+VISION_BATCH_MAX_BYTES = 8 * 1024 * 1024
+
+# Default location for cached OCR results (see cached_extract_text_with_boxes)
+OCR_CACHE_DIR = Path('output/ocr_cache')
+
+# Client is created once per process (worker processes each build their own)
+_client = None
+
 
 def get_google_vision_client():
-    """Returns Google Cloud Vision client."""
+    """Returns Google Cloud Vision client (cached per process)."""
+    global _client
+    if _client is not None:
+        return _client
+    
     if not GOOGLE_VISION_AVAILABLE:
         raise ImportError("google-cloud-vision is not installed.")
     
@@ -26,7 +47,8 @@ def get_google_vision_client():
         raise ValueError(f"Google Cloud Vision authentication file not found: {creds_path}")
     
     credentials = service_account.Credentials.from_service_account_file(creds_path)
-    return vision.ImageAnnotatorClient(credentials=credentials)
+    _client = vision.ImageAnnotatorClient(credentials=credentials)
+    return _client
 
 
 def extract_text_from_image(image_path: Path) -> str:
@@ -65,23 +87,128 @@ def extract_text_with_boxes(image_path: Path) -> list[dict]:
     Returns:
         List of dictionaries containing text and location information
     """
-    client = get_google_vision_client()
-    
     # Read image
     with open(image_path, 'rb') as image_file:
         content = image_file.read()
     
+    return extract_text_with_boxes_from_bytes(content)
+
+
+def extract_text_with_boxes_from_bytes(content: bytes) -> list[dict]:
+    """Extract text and location information from encoded image bytes.
+    
+    Lets callers that already hold the file contents (e.g. to decode them with
+    OpenCV) send them to Vision without reading the file again.
+    
+    Args:
+        content: Encoded image bytes (PNG/JPEG)
+        
+    Returns:
+        List of dictionaries containing text and location information
+    """
+    client = get_google_vision_client()
+    
     image = vision.Image(content=content)
     response = client.text_detection(image=image)
     
     if response.error.message:
         raise Exception(f"Google Vision API error: {response.error.message}")
     
+    return _parse_text_annotations(response.text_annotations)
+
+
+def cached_extract_text_with_boxes(
+    image_path: Path,
+    cache_dir: Path = OCR_CACHE_DIR,
+    content: bytes | None = None
+) -> list[dict]:
+    """Extract text boxes, reusing results cached on disk by image content.
+    
+    Results are stored as JSON under cache_dir, keyed by the SHA-1 of the image
+    bytes, so repeated runs on the same image skip the Vision API call.
+    
+    Args:
+        image_path: Image file path
+        cache_dir: Directory holding cached results
+        content: Image bytes if already read (the file is then not read again)
+        
+    Returns:
+        List of dictionaries containing text and location information
+    """
+    if content is None:
+        content = Path(image_path).read_bytes()
+    cache_path = Path(cache_dir) / f"{hashlib.sha1(content).hexdigest()}.json"
+    
+    if cache_path.exists():
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    results = extract_text_with_boxes_from_bytes(content)
+    
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f)
+    
+    return results
+
+
+def extract_text_with_boxes_batch(image_paths: list[Path]) -> list[list[dict]]:
+    """Extract text boxes from several images with batched Vision API requests.
+    
+    Sends up to VISION_BATCH_SIZE images (and at most VISION_BATCH_MAX_BYTES
+    of image data) per request, so N images cost about ceil(N / 16) round
+    trips instead of N. An image larger than the byte cap is sent on its own.
+    
+    Args:
+        image_paths: Image file paths
+        
+    Returns:
+        One list of text boxes per image (same format as extract_text_with_boxes),
+        empty for images the API reported an error for
+    """
+    client = get_google_vision_client()
+    feature = vision.Feature(type_=vision.Feature.Type.TEXT_DETECTION)
+    
     results = []
+    for chunk in _iter_batches(image_paths):
+        requests = [
+            vision.AnnotateImageRequest(image=vision.Image(content=content), features=[feature])
+            for _, content in chunk
+        ]
+        batch = client.batch_annotate_images(requests=requests)
+        
+        for (image_path, _), response in zip(chunk, batch.responses):
+            if response.error.message:
+                logger.error(f"Google Vision API error for {image_path}: {response.error.message}")
+                results.append([])
+            else:
+                results.append(_parse_text_annotations(response.text_annotations))
     
-    if response.text_annotations:
+    return results
+
+
+def _iter_batches(image_paths: list[Path]):
+    """Yield lists of (path, image bytes) capped by VISION_BATCH_SIZE and VISION_BATCH_MAX_BYTES."""
+    chunk: list[tuple[Path, bytes]] = []
+    size = 0
+    for image_path in image_paths:
+        content = Path(image_path).read_bytes()
+        if chunk and (len(chunk) >= VISION_BATCH_SIZE or size + len(content) > VISION_BATCH_MAX_BYTES):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append((image_path, content))
+        size += len(content)
+    if chunk:
+        yield chunk
+
+
+def _parse_text_annotations(text_annotations) -> list[dict]:
+    """Convert Vision text annotations to text box dictionaries."""
+    results = []
+    
+    if text_annotations:
         # First one is full text, rest are individual words/text regions
-        for annotation in response.text_annotations[1:]:
+        for annotation in text_annotations[1:]:
             vertices = annotation.bounding_poly.vertices
             
             if len(vertices) >= 3:
@@ -2,6 +2,7 @@
 
 import re
 from datetime import datetime
+from functools import lru_cache
 
 
 def parse_quarter(text: str) -> str | None:
@@ -255,6 +256,7 @@ def extract_from_boxes(boxes: list[dict]) -> list[dict]:
     return results
 
 
+@lru_cache(maxsize=2048)
 def get_report_date_from_filename(filename: str) -> str:
     """Extract report date from filename.
     
@@ -1,17 +1,28 @@
 """Main processor for extracting quarters and values from chart images."""
 
 import logging
+import multiprocessing
+import re
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Literal
 
 import cv2
+import numpy as np
 import pandas as pd
 
 from ...utils.csv_storage import read_csv
 from ...utils.cloudflare import read_csv_from_cloud
 from .bar_classifier import classify_all_bars
 from .coordinate_matcher import match_quarters_with_numbers
-from .google_vision_processor import extract_text_from_image, extract_text_with_boxes
+from .google_vision_processor import (
+    VISION_BATCH_SIZE,
+    extract_text_from_image,
+    extract_text_with_boxes_batch,
+    extract_text_with_boxes_from_bytes
+)
 from .parser import (
     extract_quarter_eps_pairs,
     get_report_date_from_filename
@@ -24,20 +35,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+ParallelMode = Literal['process', 'thread']
+
+# Quarter column names: Q1'14 or Q114
+_QUARTER_SORT_RE = re.compile(r"Q(\d)'?(\d{2})$")
+
 
-def process_image(image_path: Path) -> list[dict]:
+def process_image(image_path: Path, ocr_results: list[dict] | None = None) -> list[dict]:
     """Extract quarter and EPS information from a single image.
     
     Args:
         image_path: Image file path
+        ocr_results: Precomputed OCR text boxes (None to run OCR on the image)
         
     Returns:
         List of dictionaries containing quarter and EPS information
     """
     try:
-        # Perform OCR
-        ocr_results = extract_text_with_boxes(image_path)
-        logger.debug(f"OCR results count: {len(ocr_results)}")
+        # Read the file once: the bytes feed both Vision OCR and the OpenCV decode below
+        data = image_path.read_bytes()
+        
+        # Perform OCR (unless already done in a batch)
+        if ocr_results is None:
+            ocr_results = extract_text_with_boxes_from_bytes(data)
+        logger.debug("OCR results count: %d", len(ocr_results))
         
         if not ocr_results:
             logger.warning(f"No OCR results for image: {image_path}")
@@ -45,10 +66,15 @@ def process_image(image_path: Path) -> list[dict]:
         
         # Coordinate-based matching
         matched_results = match_quarters_with_numbers(ocr_results)
-        logger.debug(f"Matched results count: {len(matched_results)}")
+        logger.debug("Matched results count: %d", len(matched_results))
+        
+        # Nothing to classify: skip the image decode and classifier entirely
+        if not matched_results:
+            logger.warning(f"No matched results for image: {image_path}")
+            return []
         
         # Bar graph classification
-        image = cv2.imread(str(image_path))
+        image = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
         if image is None:
             logger.error(f"Cannot read image: {image_path}")
             return []
@@ -59,10 +85,6 @@ def process_image(image_path: Path) -> list[dict]:
             use_multiple_methods=True
         )
         
-        if not matched_results:
-            logger.warning(f"No matched results for image: {image_path}")
-            return []
-        
         # Add report date
         report_date = get_report_date_from_filename(image_path.name)
         
@@ -93,8 +115,11 @@ def process_image(image_path: Path) -> list[dict]:
 
 def _load_existing_data() -> tuple[pd.DataFrame | None, pd.DataFrame | None, set[str]]:
     """Load existing data from public URL and get processed dates."""
-    existing_df = read_csv_from_cloud("extracted_estimates.csv")
-    existing_confidence_df = read_csv_from_cloud("extracted_estimates_confidence.csv")
+    # Both reads are latency-bound and independent, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        main_future = executor.submit(read_csv_from_cloud, "extracted_estimates.csv")
+        confidence_future = executor.submit(read_csv_from_cloud, "extracted_estimates_confidence.csv")
+        existing_df, existing_confidence_df = main_future.result(), confidence_future.result()
     processed_dates = set()
     
     if existing_df is not None and not existing_df.empty:
@@ -118,43 +143,95 @@ def _get_images_to_process(directory: Path, processed_dates: set[str], limit: in
 
 def _merge_data(current_df: pd.DataFrame, new_df: pd.DataFrame) -> pd.DataFrame:
     """Merge new data with existing data."""
-    if current_df.empty:
-        return new_df.copy()
-    
     if new_df.empty:
         return current_df.copy()
     
     # Create copies to avoid modifying originals
-    current_copy = current_df.copy()
     new_copy = new_df.copy()
-    
-    # Ensure Report_Date is datetime (both should already be datetime, but ensure consistency)
-    current_copy['Report_Date'] = pd.to_datetime(current_copy['Report_Date'])
     new_copy['Report_Date'] = pd.to_datetime(new_copy['Report_Date'])
+    frames = [new_copy]
+    
+    if not current_df.empty:
+        current_copy = current_df.copy()
+        # Ensure Report_Date is datetime (should already be datetime, but ensure consistency)
+        current_copy['Report_Date'] = pd.to_datetime(current_copy['Report_Date'])
+        frames.insert(0, current_copy)
     
     # Debug: log counts before merge
-    logger.debug(f"Merging: current={len(current_copy)} records, new={len(new_copy)} records")
+    logger.debug("Merging: current=%d records, new=%d records", len(current_df), len(new_copy))
     
     # Concat and deduplicate (keep='last' means new data overwrites old for same date)
-    result_df = pd.concat([current_copy, new_copy], ignore_index=True)\
+    result_df = pd.concat(frames, ignore_index=True)\
         .drop_duplicates(subset=['Report_Date'], keep='last')\
         .sort_values('Report_Date')\
         .reset_index(drop=True)
     
     # Debug: log count after merge
-    logger.debug(f"After merge: {len(result_df)} records")
+    logger.debug("After merge: %d records", len(result_df))
     
     # Sort quarter columns
-    quarter_cols = sorted([c for c in result_df.columns if c != 'Report_Date'], key=_parse_quarter_for_sort)
+    quarter_cols = _sort_quarter_columns(c for c in result_df.columns if c != 'Report_Date')
     return result_df[['Report_Date'] + quarter_cols]
 
 
-def process_directory(directory: Path, limit: int | None = None) -> tuple[pd.DataFrame, pd.DataFrame]:
+def _process_chunk(image_files: list[Path]) -> list[list[dict]]:
+    """OCR a chunk of images with one batched Vision request, then process each image."""
+    try:
+        ocr_batch = extract_text_with_boxes_batch(image_files)
+    except Exception as e:
+        logger.warning(f"Batched OCR unavailable, falling back to per-image requests: {e}")
+        return [process_image(image_path) for image_path in image_files]
+    
+    return [process_image(image_path, ocr) for image_path, ocr in zip(image_files, ocr_batch)]
+
+
+def _init_worker() -> None:
+    """Keep OpenCV single-threaded in pool workers so its threads don't oversubscribe cores."""
+    cv2.setNumThreads(1)
+
+
+def _iter_image_results(
+    image_files: list[Path],
+    workers: int,
+    parallel_mode: ParallelMode = 'process'
+) -> Iterator[tuple[Path, list[dict]]]:
+    """Yield (image_path, results) in input order, using a worker pool when workers > 1."""
+    # Chunks share one Vision request; keep at least one chunk per worker
+    chunk_size = max(1, min(VISION_BATCH_SIZE, -(-len(image_files) // max(workers, 1))))
+    chunks = [image_files[i:i + chunk_size] for i in range(0, len(image_files), chunk_size)]
+    
+    if workers <= 1:
+        for chunk in chunks:
+            yield from zip(chunk, _process_chunk(chunk))
+        return
+    
+    if parallel_mode == 'thread':
+        # Vision calls release the GIL while waiting, so threads overlap them without process startup
+        executor = ThreadPoolExecutor(max_workers=workers)
+    else:
+        # spawn: each worker starts clean and creates its own OCR client once
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                       initializer=_init_worker)
+    
+    with executor:
+        for chunk, results in zip(chunks, executor.map(_process_chunk, chunks)):
+            yield from zip(chunk, results)
+
+
+def process_directory(
+    directory: Path,
+    limit: int | None = None,
+    workers: int = 1,
+    parallel_mode: ParallelMode = 'process'
+) -> tuple[pd.DataFrame, pd.DataFrame]:
     """Process all images in a directory.
     
     Args:
         directory: Directory path containing images
         limit: Maximum number of images to process (None to process all)
+        workers: Number of workers for per-image OCR (1 to process serially)
+        parallel_mode: 'process' for a process pool (CPU-bound classification),
+                       'thread' for a thread pool (Vision API latency dominates)
         
     Returns:
         Tuple of (main DataFrame, confidence DataFrame)
@@ -173,7 +250,7 @@ def process_directory(directory: Path, limit: int | None = None) -> tuple[pd.Dat
                 existing_confidence_df if existing_confidence_df is not None and not existing_confidence_df.empty else empty_df)
     
     # Process images
-    print(f"\n🔄 Processing {len(image_files)} new images...")
+    print(f"\n🔄 Processing {len(image_files)} new images (workers: {max(workers, 1)}, {parallel_mode})...")
     
     # Initialize current_df with existing data (deep copy to avoid modification)
     if existing_df is not None and not existing_df.empty:
@@ -181,39 +258,41 @@ def process_directory(directory: Path, limit: int | None = None) -> tuple[pd.Dat
         # Ensure Report_Date is datetime (should already be, but ensure consistency)
         current_df['Report_Date'] = pd.to_datetime(current_df['Report_Date'])
         print(f"📋 Loaded {len(current_df)} existing records")
-        logger.debug(f"Existing dates: {sorted(current_df['Report_Date'].dt.strftime('%Y-%m-%d').tolist()[:5])}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Existing dates: %s...", sorted(current_df['Report_Date'].dt.strftime('%Y-%m-%d').tolist()[:5]))
     else:
         current_df = pd.DataFrame()
         print("📋 No existing data found")
     
     all_long_results = []
+    new_frames = []
+    n_images = len(image_files)
     
-    for idx, image_path in enumerate(image_files, 1):
-        print(f"[{idx}/{len(image_files)}] {image_path.name}", end=" ... ")
+    for idx, (image_path, results) in enumerate(_iter_image_results(image_files, workers, parallel_mode), 1):
+        print(f"[{idx}/{n_images}] {image_path.name}", end=" ... ")
         
         try:
-            results = process_image(image_path)
             if not results:
                 print("⚠️  No data")
                 continue
             
+            new_frames.append(convert_to_wide_format(pd.DataFrame(results)))
             all_long_results.extend(results)
-            new_df = convert_to_wide_format(pd.DataFrame(results))
-            
-            # Debug: check before merge
-            before_count = len(current_df)
-            current_df = _merge_data(current_df, new_df)
-            after_count = len(current_df)
-            
-            if after_count < before_count:
-                logger.warning(f"Data loss detected: {before_count} -> {after_count} records")
-            
             print("✅")
                 
         except Exception as e:
             print(f"❌ {e}")
             logger.error(f"Error: {e}")
     
+    # Merge all new rows into the history once (instead of re-sorting the full history per image)
+    if new_frames:
+        before_count = len(current_df)
+        current_df = _merge_data(current_df, pd.concat(new_frames, ignore_index=True))
+        after_count = len(current_df)
+        
+        if after_count < before_count:
+            logger.warning(f"Data loss detected: {before_count} -> {after_count} records")
+    
     print(f"\n📊 Complete: {len(current_df)} total records (existing: {len(existing_df) if existing_df is not None and not existing_df.empty else 0}, new: {len(image_files)})\n")
     
     # If no new data was processed, return existing data
@@ -252,6 +331,11 @@ def _calculate_new_confidence(all_long_results: list, current_df: pd.DataFrame)
     
     df_long = pd.DataFrame(all_long_results)
     
+    # Low-cardinality labels: categorical codes are smaller and cheaper to compare than Python strings
+    for col in ('quarter', 'bar_color'):
+        if col in df_long.columns:
+            df_long[col] = df_long[col].astype('category')
+    
     # Normalize report_date to datetime
     df_long['report_date'] = pd.to_datetime(df_long['report_date'])
     new_dates = set(df_long['report_date'].dt.strftime('%Y-%m-%d'))
@@ -259,7 +343,7 @@ def _calculate_new_confidence(all_long_results: list, current_df: pd.DataFrame)
     # Create copy to avoid modifying original
     df_copy = current_df.copy()
     df_copy['Report_Date'] = pd.to_datetime(df_copy['Report_Date'])
-    new_df_wide = df_copy[df_copy['Report_Date'].dt.strftime('%Y-%m-%d').isin(new_dates)].copy()
+    new_df_wide = df_copy[df_copy['Report_Date'].dt.strftime('%Y-%m-%d').isin(new_dates)]
     
     if new_df_wide.empty:
         logger.warning(f"No matching dates found. new_dates: {new_dates}, current_df dates: {df_copy['Report_Date'].dt.strftime('%Y-%m-%d').tolist()}")
@@ -298,23 +382,17 @@ def convert_to_wide_format(df: pd.DataFrame) -> pd.DataFrame:
         return pd.DataFrame(columns=['Report_Date'])
     
     # Add * to EPS values (if bar_color is 'light', mark as estimate)
-    df = df.copy()
+    eps_str = df['eps'].astype(str)
     if 'bar_color' in df.columns:
         # Light bar graphs are marked as estimates (* added)
-        df['eps_str'] = df.apply(
-            lambda row: f"{row['eps']}*" if row.get('bar_color') == 'light' else str(row['eps']),
-            axis=1
-        )
-    else:
-        df['eps_str'] = df['eps'].astype(str)
+        eps_str += np.where(df['bar_color'] == 'light', '*', '')
     
-    # Convert to wide format using pivot
-    df_pivot = df.pivot_table(
-        index='report_date',
-        columns='quarter',
-        values='eps_str',
-        aggfunc='first'  # Use first value if multiple combinations exist
-    )
+    # Only the three pivot columns are needed, so build them instead of copying the whole frame
+    df_eps = pd.DataFrame({'report_date': df['report_date'], 'quarter': df['quarter'], 'eps_str': eps_str})
+    
+    # Convert to wide format using pivot (keep first value if multiple combinations exist)
+    df_pivot = df_eps.drop_duplicates(subset=['report_date', 'quarter'], keep='first')\
+        .pivot(index='report_date', columns='quarter', values='eps_str')
     
     # Convert index to column
     df_pivot = df_pivot.reset_index()
@@ -327,10 +405,7 @@ def convert_to_wide_format(df: pd.DataFrame) -> pd.DataFrame:
     df_pivot['Report_Date'] = pd.to_datetime(df_pivot['Report_Date'])
     
     # Sort quarter columns (Q1'14, Q2'14, ... order)
-    quarter_columns = sorted(
-        [col for col in df_pivot.columns if col != 'Report_Date'],
-        key=lambda x: _parse_quarter_for_sort(x)
-    )
+    quarter_columns = _sort_quarter_columns(col for col in df_pivot.columns if col != 'Report_Date')
     
     # Column order: Report_Date, Q1'14, Q2'14, ...
     df_pivot = df_pivot[['Report_Date'] + quarter_columns]
@@ -351,26 +426,32 @@ def calculate_confidence_dataframe(
     
     # Ensure Report_Date is datetime for comparison
     consistency_df['Report_Date'] = pd.to_datetime(consistency_df['Report_Date'])
-    first_date = sorted(consistency_df['Report_Date'].unique())[0] if len(consistency_df) > 0 else None
+    first_date = consistency_df['Report_Date'].min() if len(consistency_df) > 0 else None
     
-    # Normalize df_long report_date to datetime for comparison
-    df_long = df_long.copy()
-    df_long['report_date'] = pd.to_datetime(df_long['report_date'])
+    # Normalize df_long report dates to datetime for comparison (read-only, so no copy of df_long)
+    long_dates = pd.to_datetime(df_long['report_date'])
+    
+    # Index both frames once instead of scanning them for every date
+    long_by_date = dict(iter(df_long.groupby(long_dates, sort=False)))
+    bar_scores = _calculate_bar_scores(df_long, long_dates)
+    history, positions = _index_history(consistency_df)
+    
+    # Parse all report dates in one pass for comparison
+    report_dates_dt = pd.to_datetime(df_wide['Report_Date'])
     
     results = []
-    for report_date in df_wide['Report_Date']:
-        # Convert report_date to datetime for comparison
-        report_date_dt = pd.to_datetime(report_date)
-        date_data = df_long[df_long['report_date'] == report_date_dt]
+    for report_date, report_date_dt in zip(df_wide['Report_Date'], report_dates_dt):
+        date_data = long_by_date.get(report_date_dt)
         
-        if date_data.empty:
+        if date_data is None:
             logger.warning(f"No matching data for date {report_date} in df_long")
             results.append({'Report_Date': report_date, 'Confidence': 0.0})
             continue
         
-        bar_score = _calculate_bar_score(date_data)
+        # Python float: round() on np.float64 rounds ties differently
+        bar_score = float(bar_scores.get(report_date_dt, 0.0))
         consistency_score = 100.0 if report_date_dt == first_date else \
-            calculate_consistency_with_previous_week_wide(str(report_date_dt.date()), date_data, consistency_df)
+            _consistency_score(report_date_dt, date_data, history, positions)
         
         confidence = round((bar_score * 0.5) + (consistency_score * 0.5), 1)
         results.append({'Report_Date': report_date, 'Confidence': confidence})
@@ -378,14 +459,14 @@ def calculate_confidence_dataframe(
     return pd.DataFrame(results)
 
 
-def _calculate_bar_score(date_data: pd.DataFrame) -> float:
-    """Calculate bar classification confidence score."""
-    if 'bar_confidence' not in date_data.columns:
-        return 0.0
+def _calculate_bar_scores(df_long: pd.DataFrame, report_dates: pd.Series) -> pd.Series:
+    """Calculate bar classification confidence score per report date (mean over its bars)."""
+    if 'bar_confidence' not in df_long.columns:
+        return pd.Series(dtype=float)
     
     scores = {'high': 100.0, 'medium': 67.0, 'low': 33.0}
-    bar_scores = [scores.get(conf, 0.0) for conf in date_data['bar_confidence']]
-    return sum(bar_scores) / len(bar_scores) if bar_scores else 0.0
+    bar_score = df_long['bar_confidence'].map(scores).fillna(0.0)
+    return bar_score.groupby(report_dates).mean()
 
 
 def calculate_consistency_with_previous_week_wide(
@@ -394,84 +475,96 @@ def calculate_consistency_with_previous_week_wide(
     full_df_wide: pd.DataFrame
 ) -> float:
     """Calculate consistency with previous week (actuals only)."""
+    full_df_wide['Report_Date'] = pd.to_datetime(full_df_wide['Report_Date'])
+    history, positions = _index_history(full_df_wide)
+    return _consistency_score(pd.to_datetime(current_date), current_data, history, positions)
+
+
+def _index_history(full_df_wide: pd.DataFrame) -> tuple[pd.DataFrame, dict[pd.Timestamp, int]]:
+    """Sort wide rows by date (first row per date) and map each date to its row position.
+    
+    The previous week of the row at position i is then simply row i - 1.
+    """
+    history = full_df_wide.sort_values('Report_Date', kind='stable')\
+        .drop_duplicates(subset=['Report_Date'])\
+        .reset_index(drop=True)
+    positions = {date: i for i, date in enumerate(history['Report_Date'])}
+    return history, positions
+
+
+def _consistency_score(
+    current_dt: pd.Timestamp,
+    current_data: pd.DataFrame,
+    history: pd.DataFrame,
+    positions: dict[pd.Timestamp, int]
+) -> float:
+    """Share (%) of actual quarters whose EPS is within 20% of the previous report's value."""
     try:
-        current_dt = pd.to_datetime(current_date)
-        full_df_wide['Report_Date'] = pd.to_datetime(full_df_wide['Report_Date'])
-        
-        previous_dates = full_df_wide[full_df_wide['Report_Date'] < current_dt]['Report_Date']
-        if len(previous_dates) == 0:
+        # No row for this date (None) or no earlier report (0)
+        pos = positions.get(current_dt)
+        if not pos:
             return 0.0
         
-        previous_date = previous_dates.max()
-        current_row = full_df_wide[full_df_wide['Report_Date'] == current_dt]
-        previous_row = full_df_wide[full_df_wide['Report_Date'] == previous_date]
-        
-        if current_row.empty or previous_row.empty:
-            return 0.0
-        
-        current_row = current_row.iloc[0]
-        previous_row = previous_row.iloc[0]
-        
         # Get actual quarters (dark bars)
-        actual_quarters = set()
-        if 'bar_color' in current_data.columns:
-            actual_quarters = set(current_data[current_data['bar_color'] == 'dark']['quarter'].unique())
-        
+        if 'bar_color' not in current_data.columns:
+            return 0.0
+        actual_quarters = [
+            quarter for quarter in current_data.loc[current_data['bar_color'] == 'dark', 'quarter'].unique()
+            if quarter in history.columns
+        ]
         if not actual_quarters:
             return 0.0
         
-        # Compare values
-        matches = 0
-        total = 0
-        
-        for quarter in actual_quarters:
-            if quarter not in full_df_wide.columns:
-                continue
-            
-            curr_val = str(current_row.get(quarter, ''))
-            prev_val = str(previous_row.get(quarter, ''))
-            
-            if not curr_val or '*' in curr_val or not prev_val or '*' in prev_val:
-                continue
-            
-            try:
-                curr_eps = float(curr_val.replace('*', ''))
-                prev_eps = float(prev_val.replace('*', ''))
-                total += 1
-                
-                if abs(curr_eps - prev_eps) / max(abs(prev_eps), 0.01) <= 0.2:
-                    matches += 1
-            except (ValueError, TypeError):
-                continue
+        # Compare all quarters at once
+        curr_eps, curr_ok = _parse_actual_eps(history.loc[pos, actual_quarters])
+        prev_eps, prev_ok = _parse_actual_eps(history.loc[pos - 1, actual_quarters])
+        valid = curr_ok & prev_ok
+        total = int(valid.sum())
+        if total == 0:
+            return 0.0
         
-        return (matches / total * 100.0) if total > 0 else 0.0
+        close = np.abs(curr_eps - prev_eps) / np.maximum(np.abs(prev_eps), 0.01) <= 0.2
+        return int((close & valid).sum()) / total * 100.0
     
     except Exception as e:
-        logger.warning(f"Error calculating consistency ({current_date}): {e}")
+        logger.warning(f"Error calculating consistency ({current_dt.date()}): {e}")
         return 0.0
 
 
+def _parse_actual_eps(values: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Parse wide-format EPS cells, returning (values, usable mask); estimates ('*') are not usable."""
+    eps = np.full(len(values), np.nan)
+    usable = np.zeros(len(values), dtype=bool)
+    
+    for i, value in enumerate(values):
+        text = str(value)
+        if not text or '*' in text:
+            continue
+        try:
+            eps[i] = float(text)
+            usable[i] = True
+        except (ValueError, TypeError):
+            continue
+    
+    return eps, usable
+
+
 def _parse_quarter_for_sort(quarter: str) -> tuple[int, int]:
     """Convert quarter string to tuple for sorting.
     
     Args:
-        quarter: Quarter string (e.g., "Q1'14", "Q2'15")
+        quarter: Quarter string (e.g., "Q1'14", "Q2'15", or "Q114")
         
     Returns:
-        (year, quarter) tuple (e.g., (2014, 1), (2015, 2))
+        (year, quarter) tuple (e.g., (2014, 1), (2015, 2)), (0, 0) if unparseable
     """
-    try:
-        # Parse Q1'14 format
-        if "'" in quarter:
-            q_part, year_part = quarter.split("'")
-            q_num = int(q_part[1:])  # Q1 -> 1
-            year = 2000 + int(year_part)  # '14 -> 2014
-        else:
-            # Parse Q114 format
-            q_num = int(quarter[1])
-            year = 2000 + int(quarter[2:4])
-        
-        return (year, q_num)
-    except (ValueError, IndexError):
-        # Return (0, 0) on parse failure to sort at the beginning
-        return (0, 0)
\ No newline at end of file
+    match = _QUARTER_SORT_RE.match(quarter)
+    if not match:
+        # Sort unparseable names at the beginning
+        return (0, 0)
+    return (2000 + int(match.group(2)), int(match.group(1)))
+
+
+def _sort_quarter_columns(columns) -> list[str]:
+    """Sort quarter column names chronologically (Q1'14, Q2'14, ...)."""
+    return sorted(columns, key=_parse_quarter_for_sort)
\ No newline at end of file
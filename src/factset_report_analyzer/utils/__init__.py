@@ -3,10 +3,12 @@
 from .cloudflare import (
     CLOUD_STORAGE_ENABLED,
     upload_to_cloud,
+    upload_many_to_cloud,
     download_from_cloud,
     read_csv_from_cloud,
     write_csv_to_cloud,
     file_exists_in_cloud,
+    files_exist_in_cloud,
     list_cloud_files,
 )
 from .csv_storage import (
@@ -19,10 +21,12 @@ from .csv_storage import (
 __all__ = [
     'CLOUD_STORAGE_ENABLED',
     'upload_to_cloud',
+    'upload_many_to_cloud',
     'download_from_cloud',
     'read_csv_from_cloud',
     'write_csv_to_cloud',
     'file_exists_in_cloud',
+    'files_exist_in_cloud',
     'list_cloud_files',
     'read_csv',
     'write_csv',
@@ -1,7 +1,12 @@
 """Cloudflare R2 storage utilities."""
 
+import functools
 import io
+import json
 import os
+import posixpath
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -26,6 +31,9 @@ R2_SECRET_ACCESS_KEY = os.getenv('R2_SECRET_ACCESS_KEY', '')
 # Public URL for CSV files (no auth needed)
 R2_PUBLIC_URL = "https://pub-62707afd3ebb422aae744c63c49d36a0.r2.dev"
 
+# Local copies of public files, revalidated with conditional GETs
+PUBLIC_CACHE_DIR = Path(tempfile.gettempdir()) / 'factset_public_cache'
+
 # Cloud storage flags
 _has_creds = all([R2_BUCKET_NAME, R2_ACCOUNT_ID, R2_ACCESS_KEY_ID, R2_SECRET_ACCESS_KEY])
 _is_ci = os.getenv('CI', '').lower() == 'true'
@@ -36,8 +44,9 @@ CLOUD_STORAGE_ENABLED = (_is_ci or _enabled) and _has_creds and not _disabled
 PUBLIC_BUCKET_ENABLED = CLOUD_STORAGE_ENABLED and bool(R2_PUBLIC_BUCKET_NAME)
 
 
+@functools.lru_cache(maxsize=1)
 def _get_s3_client():
-    """Get S3 client for R2."""
+    """Get S3 client for R2 (created once and shared; boto3 clients are thread-safe)."""
     if not CLOUD_STORAGE_ENABLED:
         print(f"CLOUD_STORAGE_ENABLED is False")
         return None
@@ -46,12 +55,19 @@ def _get_s3_client():
         return None
     
     try:
-        return boto3.client(
+        # Own session: the default boto3 session is not thread-safe.
+        # Keep-alive pool sized for concurrent uploads, so TLS handshakes are reused across calls.
+        return boto3.session.Session().client(
             's3',
             endpoint_url=f'https://{R2_ACCOUNT_ID}.r2.cloudflarestorage.com',
             aws_access_key_id=R2_ACCESS_KEY_ID,
             aws_secret_access_key=R2_SECRET_ACCESS_KEY,
-            config=Config(signature_version='s3v4')
+            config=Config(
+                signature_version='s3v4',
+                max_pool_connections=32,
+                retries={'max_attempts': 5, 'mode': 'adaptive'},
+                tcp_keepalive=True
+            )
         )
     except Exception as e:
         print(f"Error creating S3 client: {e}")
@@ -85,6 +101,26 @@ def upload_to_cloud(file_path: Path, cloud_path: str | None = None) -> bool:
         return False
 
 
+def upload_many_to_cloud(pairs: list[tuple[Path, str]], max_workers: int = 8) -> list[bool]:
+    """Upload several files to Cloudflare R2 concurrently.
+    
+    Uploads are latency-bound, so they run on a thread pool sharing the
+    keep-alive client (max_workers should not exceed its 32-connection pool).
+    
+    Args:
+        pairs: (local file path, cloud storage path) tuples
+        max_workers: Number of concurrent uploads (default: 8)
+        
+    Returns:
+        Upload result per pair, in input order (never raises exceptions)
+    """
+    if not pairs:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pairs)))) as executor:
+        return list(executor.map(lambda pair: upload_to_cloud(*pair), pairs))
+
+
 def download_from_cloud(cloud_path: str, local_path: Path) -> bool:
     """Download file from Cloudflare R2.
     
@@ -107,15 +143,65 @@ def download_from_cloud(cloud_path: str, local_path: Path) -> bool:
         return False
 
 
-def read_csv_from_cloud(cloud_path: str) -> pd.DataFrame | None:
-    """Read CSV from public URL (no auth needed)."""
+def _fetch_public_file(cloud_path: str) -> bytes:
+    """Fetch a file from the public URL, revalidating a local copy with a conditional GET.
+    
+    The body is cached in PUBLIC_CACHE_DIR together with its ETag/Last-Modified
+    headers (one JSON header line, then the body, written atomically); when the
+    server answers 304 Not Modified the cached body is returned instead of
+    downloading the file again.
+    """
+    import urllib.error
     import urllib.request
     
+    cache_path = PUBLIC_CACHE_DIR / cloud_path.replace('/', '_')
+    
+    headers = {'User-Agent': 'Mozilla/5.0'}
+    cached = None
+    try:
+        meta_line, cached = cache_path.read_bytes().split(b'\n', 1)
+        meta = json.loads(meta_line)
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+    except (OSError, ValueError):
+        cached = None
+    
+    req = urllib.request.Request(f"{R2_PUBLIC_URL}/{cloud_path}", headers=headers)
     try:
-        url = f"{R2_PUBLIC_URL}/{cloud_path}"
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
         with urllib.request.urlopen(req, timeout=10) as response:
-            return pd.read_csv(io.BytesIO(response.read()))
+            content = response.read()
+            meta = {'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')}
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached is not None:
+            return cached
+        raise
+    
+    # Only cache responses the server can revalidate
+    if meta['etag'] or meta['last_modified']:
+        try:
+            PUBLIC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=PUBLIC_CACHE_DIR, delete=False) as f:
+                f.write(json.dumps(meta).encode() + b'\n' + content)
+            Path(f.name).replace(cache_path)
+        except OSError:
+            pass
+    
+    return content
+
+
+def read_csv_from_cloud(cloud_path: str, usecols: list[str] | None = None) -> pd.DataFrame | None:
+    """Read CSV from public URL (no auth needed).
+    
+    Args:
+        cloud_path: Cloud file name
+        usecols: Only parse these columns (None to parse all)
+    """
+    try:
+        content = _fetch_public_file(cloud_path)
+        # Parse the whole file in one pass so dtypes of the '*'-marked quarter columns are inferred once
+        return pd.read_csv(io.BytesIO(content), usecols=usecols, low_memory=False)
     except Exception:
         return None
 
@@ -126,21 +212,19 @@ def write_csv_to_cloud(df: pd.DataFrame, cloud_path: str) -> bool:
         return False
     
     try:
-        s3_client = boto3.client(
-            's3',
-            endpoint_url=f'https://{R2_ACCOUNT_ID}.r2.cloudflarestorage.com',
-            aws_access_key_id=R2_ACCESS_KEY_ID,
-            aws_secret_access_key=R2_SECRET_ACCESS_KEY,
-            config=Config(signature_version='s3v4')
-        )
+        s3_client = _get_s3_client()
+        if not s3_client:
+            return False
         
-        csv_buffer = io.StringIO()
-        df.to_csv(csv_buffer, index=False)
-        s3_client.put_object(
-            Bucket=R2_PUBLIC_BUCKET_NAME,
-            Key=cloud_path,
-            Body=csv_buffer.getvalue().encode('utf-8'),
-            ContentType='text/csv'
+        # Encode straight into a byte buffer and stream it (no str copy + encode)
+        csv_buffer = io.BytesIO()
+        df.to_csv(csv_buffer, index=False, encoding='utf-8')
+        csv_buffer.seek(0)
+        s3_client.upload_fileobj(
+            csv_buffer,
+            R2_PUBLIC_BUCKET_NAME,
+            cloud_path,
+            ExtraArgs={'ContentType': 'text/csv'}
         )
         return True
     except Exception:
@@ -167,6 +251,52 @@ def file_exists_in_cloud(cloud_path: str) -> bool:
         return False
 
 
+def files_exist_in_cloud(cloud_paths: list[str]) -> dict[str, bool]:
+    """Check which of several files exist in Cloudflare R2.
+    
+    Paths are grouped by directory and each directory is listed once (one
+    request per 1000 keys) instead of sending one HEAD request per path.
+    Paths at the bucket root, or in a directory whose listing fails, are
+    checked individually with file_exists_in_cloud.
+    
+    Args:
+        cloud_paths: Cloud storage paths
+        
+    Returns:
+        Mapping of each path to whether it exists (never raises exceptions)
+    """
+    if not cloud_paths:
+        return {}
+    
+    s3_client = _get_s3_client()
+    if not s3_client:
+        return {path: False for path in cloud_paths}
+    
+    by_dir: dict[str, list[str]] = {}
+    for path in cloud_paths:
+        by_dir.setdefault(posixpath.dirname(path), []).append(path)
+    
+    exists = {}
+    for directory, paths in by_dir.items():
+        # Listing the root prefix would walk the whole bucket
+        if not directory:
+            exists.update({path: file_exists_in_cloud(path) for path in paths})
+            continue
+        
+        try:
+            keys = set()
+            paginator = s3_client.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=R2_BUCKET_NAME, Prefix=f"{directory}/",
+                                           PaginationConfig={'PageSize': 1000}):
+                keys.update(obj['Key'] for obj in page.get('Contents', []))
+            exists.update({path: path in keys for path in paths})
+        except Exception:
+            # A failed listing says nothing about existence: check each path instead
+            exists.update({path: file_exists_in_cloud(path) for path in paths})
+    
+    return {path: exists[path] for path in cloud_paths}
+
+
 def upload_file_to_public_cloud(file_path: Path, cloud_path: str) -> bool:
     """Upload file to public bucket (requires auth).
     
@@ -184,13 +314,9 @@ def upload_file_to_public_cloud(file_path: Path, cloud_path: str) -> bool:
         return False
     
     try:
-        s3_client = boto3.client(
-            's3',
-            endpoint_url=f'https://{R2_ACCOUNT_ID}.r2.cloudflarestorage.com',
-            aws_access_key_id=R2_ACCESS_KEY_ID,
-            aws_secret_access_key=R2_SECRET_ACCESS_KEY,
-            config=Config(signature_version='s3v4')
-        )
+        s3_client = _get_s3_client()
+        if not s3_client:
+            return False
         
         # Determine content type based on file extension
         content_type = 'application/octet-stream'
@@ -229,7 +355,7 @@ def list_cloud_files(prefix: str = '') -> list[str]:
     try:
         files = []
         paginator = s3_client.get_paginator('list_objects_v2')
-        for page in paginator.paginate(Bucket=R2_BUCKET_NAME, Prefix=prefix):
+        for page in paginator.paginate(Bucket=R2_BUCKET_NAME, Prefix=prefix, PaginationConfig={'PageSize': 1000}):
             if 'Contents' in page:
                 for obj in page['Contents']:
                     files.append(obj['Key'])
@@ -32,14 +32,14 @@ def write_csv(df: pd.DataFrame, cloud_path: str | None, local_path: Path) -> boo
 
 
 def get_last_date_from_csv(cloud_path: str | None, local_path: Path) -> datetime | None:
-    """Get last report date from CSV."""
-    df = read_csv(cloud_path, local_path)
-    if df is None or df.empty or 'Report_Date' not in df.columns:
+    """Get last report date from CSV (only the Report_Date column is parsed)."""
+    cloud_key = cloud_path or local_path.name
+    df = read_csv_from_cloud(cloud_key, usecols=['Report_Date'])
+    if df is None or df.empty:
         return None
     
     try:
-        df['Report_Date'] = pd.to_datetime(df['Report_Date'])
-        last_date = df['Report_Date'].max()
+        last_date = pd.to_datetime(df['Report_Date']).max()
         return last_date.to_pydatetime() if pd.notna(last_date) else None
     except Exception:
         return None
@@ -9,14 +9,16 @@ import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
 
-from ...analysis.sp500 import SP500
+from ...analysis.sp500 import get_sp500
 from .time_series import plot_time_series
 
 
 def plot_pe_ratio_with_price(
     output_path: Path | None = None,
     std_threshold: float = 1.5,
-    figsize: tuple[int, int] = (14, 12)
+    figsize: tuple[int, int] = (14, 12),
+    dpi: int = 150,
+    fig: plt.Figure | None = None
 ) -> None:
     """Plot S&P 500 Price with P/E Ratios, highlighting periods outside ±σ range.
     
@@ -33,6 +35,10 @@ def plot_pe_ratio_with_price(
         std_threshold: Standard deviation threshold for highlighting outliers.
                        Default: 1.5
         figsize: Figure size in inches (width, height). Default: (14, 12)
+        dpi: Resolution of the saved image. Default: 150
+        fig: Existing Figure to clear and draw into (kept open for reuse in
+             batch plotting). If None, a new figure is created and closed.
+             Default: None
     
     Returns:
         None
@@ -51,11 +57,17 @@ def plot_pe_ratio_with_price(
         >>> # Or display interactively
         >>> plot_pe_ratio_with_price()
     """
-    sp500 = SP500()
+    sp500 = get_sp500()
     type_labels = {'trailing': 'Q(-4)+Q(-3)+Q(-2)+Q(-1)', 'forward': 'Q(0)+Q(1)+Q(2)+Q(3)'}
     type_colors = {'trailing': 'green', 'forward': 'red'}
     
-    fig, axes = plt.subplots(2, 1, figsize=figsize, sharex=True)
+    owns_fig = fig is None
+    if owns_fig:
+        fig, axes = plt.subplots(2, 1, figsize=figsize, sharex=True)
+    else:
+        fig.clear()
+        fig.set_size_inches(figsize)
+        axes = fig.subplots(2, 1, sharex=True)
     fig.suptitle(f'S&P 500 Price with P/E Ratios (Last Updated: {datetime.now().strftime("%Y-%m-%d")})',
                  fontsize=16, fontweight='bold', y=0.995)
     
@@ -76,12 +88,13 @@ def plot_pe_ratio_with_price(
         axes[idx].set_title(f'S&P 500 Price with {pe_type.capitalize()}({type_labels[pe_type]}) P/E Ratio', fontsize=12, fontweight='bold')
     
     axes[-1].set_xlabel('Date', fontsize=11, fontweight='bold')
-    plt.tight_layout(rect=[0, 0, 1, 0.98])
+    fig.tight_layout(rect=[0, 0, 1, 0.98])
     
     if output_path:
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+        fig.savefig(output_path, dpi=dpi, bbox_inches='tight', facecolor='white')
         print(f"✅ Plot saved to {output_path}")
     else:
         plt.show()
-    plt.close()
+    if owns_fig:
+        plt.close(fig)
 
@@ -9,6 +9,7 @@ import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.collections import PolyCollection
 import numpy as np
 
 
@@ -84,7 +85,10 @@ def plot_time_series(
     if len(values) > 2:
         raise ValueError("Maximum 2 value series allowed")
     
-    dates_vals = pd.to_datetime(dates).values
+    # Zero-copy view for datetime64 input (any unit); parse anything else once
+    dates_vals = np.asarray(dates)
+    if not np.issubdtype(dates_vals.dtype, np.datetime64):
+        dates_vals = dates_vals.astype('datetime64[ns]')
     colors = colors or ['blue', 'red'][:len(values)]
     labels = labels or [v.name if v.name else f'Series {i+1}' for i, v in enumerate(values)]
     
@@ -95,18 +99,26 @@ def plot_time_series(
     ax2 = ax.twinx() if len(values) == 2 else None
     
     for i, val in enumerate(values):
-        (ax2 if i == 1 else ax).plot(dates_vals, val.values, color=colors[i], linewidth=1.5,
+        (ax2 if i == 1 else ax).plot(dates_vals, val.to_numpy(copy=False), color=colors[i], linewidth=1.5,
                                      label=labels[i], alpha=0.7, zorder=2)
     
-    if sigma is not None and sigma_index < len(values):
-        v = values[sigma_index].values
-        mean, std = np.mean(v), np.std(v)
+    show_sigma = sigma is not None and sigma_index < len(values)
+    if show_sigma:
+        # Thresholds are computed once for both the highlighting and the legend (NaN-aware)
+        v = values[sigma_index].to_numpy(copy=False)
+        mean, std = np.nanmean(v), np.nanstd(v)
         upper, lower = mean + sigma * std, mean - sigma * std
+        x = mdates.date2num(dates_vals)
         for mask, color in [(v > upper, 'red'), (v < lower, 'blue')]:
-            starts = np.where(np.diff(np.concatenate(([False], mask, [False]))))[0]
-            for i in range(0, len(starts), 2):
-                if i+1 < len(starts):
-                    ax.axvspan(dates_vals[starts[i]], dates_vals[starts[i+1]-1], alpha=0.2, color=color, zorder=0)
+            # (start, end) index pairs of each run outside the band, one collection per color
+            runs = np.flatnonzero(np.diff(np.r_[False, mask, False])).reshape(-1, 2)
+            if len(runs):
+                x0, x1 = x[runs[:, 0]], x[runs[:, 1] - 1]
+                verts = np.stack([np.c_[x0, np.zeros_like(x0)], np.c_[x0, np.ones_like(x0)],
+                                  np.c_[x1, np.ones_like(x1)], np.c_[x1, np.zeros_like(x1)]], axis=1)
+                # x in data coordinates, y spanning the full axes height (as axvspan)
+                ax.add_collection(PolyCollection(verts, transform=ax.get_xaxis_transform(),
+                                                 facecolor=color, edgecolor=color, alpha=0.2, zorder=0))
         target_ax = ax2 if sigma_index == 1 and ax2 else ax
         for y, style in [(mean, '--'), (upper, ':'), (lower, ':')]:
             target_ax.axhline(y=y, color='gray' if style == '--' else 'gold', linestyle=style, 
@@ -126,10 +138,7 @@ def plot_time_series(
         lines2, lbls2 = ax2.get_legend_handles_labels()
         lines, lbls = lines + lines2, lbls + lbls2
     
-    if sigma is not None and sigma_index < len(values):
-        v = values[sigma_index].values
-        mean, std = np.mean(v), np.std(v)
-        upper, lower = mean + sigma * std, mean - sigma * std
+    if show_sigma:
         lines.extend([
             plt.Line2D([0], [0], color='gray', linestyle='--', linewidth=1.2, label=f'Mean: {mean:.2f}'),
             plt.Line2D([0], [0], color='gold', linestyle=':', linewidth=1.2, label=f'+{sigma}σ: {upper:.2f}'),